@@ -5,14 +5,19 @@ Feature 005 - Claims Workbench
 
 import random
 from datetime import datetime, timedelta, timezone
-from typing import List, Optional, Dict
+from typing import AsyncIterator, List, Optional, Dict
 
 from fastapi import APIRouter, Depends, HTTPException, Query
+from fastapi.responses import StreamingResponse
 from pydantic import BaseModel
 from sqlalchemy.ext.asyncio import AsyncConnection
 
-from app.db.database import get_db
-from app.db.repositories.claim_repo import ClaimRepository
+from app.db.database import get_db, get_db_connection
+from app.db.repositories.claim_repo import (
+    ClaimAlreadyAssignedError,
+    ClaimRepository,
+    VersionConflictError,
+)
 from app.services.claim_service import ClaimService
 from app.models.workbench import (
     Claim,
@@ -168,6 +173,7 @@ async def list_claims(
     search: Optional[str] = Query(None, description="Search by claim ID or claimant name"),
     limit: int = Query(50, ge=1, le=100),
     offset: int = Query(0, ge=0),
+    after: Optional[str] = Query(None, description="Return claims after this claim ID (keyset pagination; overrides offset)"),
     service: ClaimService = Depends(get_claim_service)
 ):
     """
@@ -183,7 +189,8 @@ async def list_claims(
             created_to=created_to,
             search=search,
             limit=limit,
-            offset=offset
+            offset=offset,
+            after=after
         )
         return claims
 
@@ -194,11 +201,47 @@ async def list_claims(
         created_to=created_to,
         search=search,
         limit=limit,
-        offset=offset
+        offset=offset,
+        after=after
     )
     return claims
 
 
+@router.get("/export", response_model=List[Claim])
+async def export_claims(
+    handler_id: Optional[str] = Query(None, description="Filter by assigned handler ID"),
+    status: Optional[ClaimStatus] = Query(None, description="Filter by claim status"),
+    claim_type: Optional[str] = Query(None, description="Filter by claim type"),
+    created_from: Optional[str] = Query(None, description="Filter by created_at start (ISO)"),
+    created_to: Optional[str] = Query(None, description="Filter by created_at end (ISO)"),
+    search: Optional[str] = Query(None, description="Search by claim ID or claimant name"),
+):
+    """
+    Stream every matching claim as a single JSON array.
+    Rows are encoded as they arrive from the database, so memory stays flat
+    regardless of how many claims match.
+    """
+
+    async def encode() -> AsyncIterator[bytes]:
+        # The stream outlives the request-scoped dependencies, so it holds
+        # its own connection for as long as the response body is being sent.
+        async with get_db_connection() as db:
+            separator = b"["
+            async for claim in ClaimRepository(db).iter_claims(
+                handler_id=handler_id,
+                status=status,
+                claim_type=claim_type,
+                created_from=created_from,
+                created_to=created_to,
+                search=search,
+            ):
+                yield separator + claim.model_dump_json().encode()
+                separator = b","
+            yield b"[]" if separator == b"[" else b"]"
+
+    return StreamingResponse(encode(), media_type="application/json")
+
+
 @router.get("/handlers", response_model=List[Handler])
 async def list_handlers(
     service: ClaimService = Depends(get_claim_service)
@@ -277,6 +320,7 @@ async def get_review_queue(
     search: Optional[str] = Query(None, description="Search by claim ID or claimant name"),
     limit: int = Query(50, ge=1, le=100),
     offset: int = Query(0, ge=0),
+    after: Optional[str] = Query(None, description="Return claims after this claim ID (keyset pagination; overrides offset)"),
     service: ClaimService = Depends(get_claim_service)
 ):
     """Get AI-processed, unassigned claims ready for review."""
@@ -287,7 +331,8 @@ async def get_review_queue(
         created_to=created_to,
         search=search,
         limit=limit,
-        offset=offset
+        offset=offset,
+        after=after
     )
     return claims
 
@@ -300,6 +345,7 @@ async def get_processing_queue(
     search: Optional[str] = Query(None, description="Search by claim ID or claimant name"),
     limit: int = Query(50, ge=1, le=100),
     offset: int = Query(0, ge=0),
+    after: Optional[str] = Query(None, description="Return claims after this claim ID (keyset pagination; overrides offset)"),
     service: ClaimService = Depends(get_claim_service)
 ):
     """Get claims pending or processing AI."""
@@ -309,7 +355,8 @@ async def get_processing_queue(
         created_to=created_to,
         search=search,
         limit=limit,
-        offset=offset
+        offset=offset,
+        after=after
     )
     return claims
 
@@ -340,11 +387,17 @@ async def assign_claim(
     Assign a claim to a handler.
     Fails if claim is already assigned or AI is not complete.
     """
-    claim = await service.assign_claim(claim_id, handler_id)
+    try:
+        claim = await service.assign_claim(claim_id, handler_id)
+    except ClaimAlreadyAssignedError as exc:
+        raise HTTPException(
+            status_code=409,
+            detail=f"Claim is already assigned to {exc.handler_id}"
+        )
     if not claim:
         raise HTTPException(
             status_code=409,
-            detail="Claim could not be assigned (it may not exist, AI is not complete, or it is already assigned)"
+            detail="Claim could not be assigned (it may not exist or AI is not complete)"
         )
     return claim
 
@@ -410,7 +463,13 @@ async def record_decision(
         ai_assessment_id=decision_in.ai_assessment_id
     )
          
-    decision = await service.record_decision(claim_id, decision_create)
+    try:
+        decision = await service.record_decision(claim_id, decision_create)
+    except VersionConflictError:
+        raise HTTPException(
+            status_code=409,
+            detail="Claim was modified concurrently; reload and try again",
+        )
     if not decision:
         raise HTTPException(status_code=404, detail="Claim not found")
     return decision
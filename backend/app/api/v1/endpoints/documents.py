@@ -201,12 +201,14 @@ async def upload_documents_for_indexing(
             
             for doc in uploaded_docs:
                 file_path = get_category_dir(doc.category) / doc.filename
-                if policy_search.add_document_to_index(file_path):
+                # Persist the index once after the batch, not per document
+                if policy_search.add_document_to_index(file_path, persist=False):
                     # Update metadata to mark as indexed
                     metadata_dict[doc.id].indexed = True
                     indexed_count += 1
             
             if indexed_count > 0:
+                policy_search.save_index()
                 # Save updated metadata
                 save_document_metadata(metadata_dict)
                 logger.info(f"Successfully indexed {indexed_count} out of {len(uploaded_docs)} documents")
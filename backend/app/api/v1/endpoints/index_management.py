@@ -5,6 +5,7 @@ including rebuilding, resetting, and monitoring index status.
 """
 from __future__ import annotations
 
+import asyncio
 import json
 import logging
 from datetime import datetime
@@ -229,10 +230,10 @@ async def rebuild_index(
                 status=current_status
             )
         
-        # For now, do synchronous rebuild
-        # In production, you'd want to use background tasks for large indexes
+        # Re-embedding every document is blocking; run it in a worker thread.
+        # The live index is swapped only once the new one is built.
         logger.info("Starting index rebuild...")
-        new_status = rebuild_index_sync(include_uploaded=include_uploaded)
+        new_status = await asyncio.to_thread(rebuild_index_sync, include_uploaded=include_uploaded)
         
         if new_status.status == "ready":
             return IndexRebuildResponse(
@@ -269,7 +270,7 @@ async def reset_index_to_original() -> IndexResetResponse:
         save_document_metadata(metadata_dict)
         
         # Rebuild index with only original policies
-        new_status = rebuild_index_sync(include_uploaded=False)
+        new_status = await asyncio.to_thread(rebuild_index_sync, include_uploaded=False)
         
         if new_status.status == "ready":
             return IndexResetResponse(
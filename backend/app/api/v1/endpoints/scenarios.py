@@ -4,16 +4,34 @@ API endpoints for AI-powered demo scenario generation.
 Based on contracts/scenarios-api.yaml from specs/004-ai-demo-examples/
 """
 
+import asyncio
+import functools
+import hashlib
 import logging
+from datetime import datetime
 from typing import Optional
 from uuid import UUID
 
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Request, Response, status
+from fastapi.responses import ORJSONResponse
+from sqlalchemy.ext.asyncio import AsyncConnection
 
-from app.db.database import get_db_connection
+from app.db.database import get_db
+from app.db.policy_repo import (
+    PolicyCreate,
+    check_coverage,
+    get_policy_by_policy_number,
+    upsert_policy,
+)
 from app.db.repositories.scenario_repo import ScenarioRepository
+from app.db.vehicle_repo import (
+    VehicleCreate,
+    get_vehicle_by_vin as repo_get_vehicle,
+    upsert_vehicle,
+)
 from app.models.scenario import (
     ClaimType,
+    CoverageLimits,
     ErrorResponse,
     GeneratedScenario,
     Locale,
@@ -29,7 +47,139 @@ from app.workflow.policy_search import get_policy_search
 
 logger = logging.getLogger(__name__)
 
-router = APIRouter(prefix="/scenarios", tags=["scenarios"])
+# Every generated policy carries the full set of CoverageLimits fields
+_COVERAGE_TYPES = tuple(CoverageLimits.model_fields)
+
+# Scenario payloads embed full policy markdown; encode them with orjson
+router = APIRouter(
+    prefix="/scenarios",
+    tags=["scenarios"],
+    default_response_class=ORJSONResponse,
+)
+
+
+async def get_scenario_repo(db: AsyncConnection = Depends(get_db)) -> ScenarioRepository:
+    """Dependency to get a ScenarioRepository on a request-scoped connection."""
+    return ScenarioRepository(db)
+
+
+def _scenario_etag(scenario_id: UUID, version: datetime) -> str:
+    digest = hashlib.blake2b(
+        scenario_id.bytes + version.isoformat().encode(), digest_size=16
+    ).hexdigest()
+    return f'"{digest}"'
+
+
+@functools.lru_cache(maxsize=1)
+def _templates_etag() -> str:
+    """ETag for the preset templates, which are static for the process lifetime."""
+    templates = TemplateListResponse(templates=get_scenario_generator().get_templates())
+    digest = hashlib.blake2b(
+        templates.model_dump_json().encode(), digest_size=16
+    ).hexdigest()
+    return f'"{digest}"'
+
+
+def _etag_matches(request: Request, etag: str) -> bool:
+    """Check an If-None-Match header against ``etag``."""
+    if_none_match = request.headers.get("if-none-match")
+    if not if_none_match:
+        return False
+    candidates = {tag.strip().removeprefix("W/") for tag in if_none_match.split(",")}
+    return etag in candidates or "*" in candidates
+
+
+async def _maybe_create_vehicle(scenario: GeneratedScenario) -> None:
+    """Create the vehicle record (for get_vehicle_details tool) if missing."""
+    vi = scenario.claim.vehicle_info
+    if not vi:
+        return
+
+    # Built from the already-validated scenario, so skip re-validation
+    vehicle_create = VehicleCreate.model_construct(
+        vin=vi.vin,
+        scenario_id=scenario.id,
+        policy_number=scenario.claim.policy_number,
+        make=vi.make,
+        model=vi.model,
+        year=vi.year,
+        license_plate=vi.license_plate,
+        color=vi.color,
+        vehicle_type=vi.vehicle_type,
+    )
+    if await upsert_vehicle(vehicle_create):
+        logger.info("Created vehicle record: %s", vi.vin)
+    else:
+        logger.info("Vehicle record already exists: %s", vi.vin)
+
+
+async def _maybe_create_policy(scenario: GeneratedScenario) -> None:
+    """Create the policy record (for get_policy_details tool) if missing."""
+    # Extract coverage info from generated policy
+    policy = scenario.policy
+    customer_info = scenario.claim.customer_info
+    vehicle_info = scenario.claim.vehicle_info
+
+    coverage_limits_dict = policy.coverage_limits.limits_dict
+
+    policy_create = PolicyCreate.model_construct(
+        policy_number=policy.policy_number,
+        scenario_id=scenario.id,
+        policy_type=policy.policy_type,
+        coverage_types=_COVERAGE_TYPES,
+        coverage_limits=coverage_limits_dict,
+        deductible=policy.deductibles.collision,
+        premium=1200.0,  # Default premium for demo
+        effective_date=policy.effective_date,
+        expiration_date=policy.expiration_date,
+        customer_name=customer_info.name if customer_info else scenario.claim.claimant_name,
+        customer_email=customer_info.email if customer_info else None,
+        customer_phone=customer_info.phone if customer_info else None,
+        vin=vehicle_info.vin if vehicle_info else None,
+    )
+    if await upsert_policy(policy_create):
+        logger.info("Created policy record: %s", policy.policy_number)
+    else:
+        logger.info("Policy record already exists: %s", policy.policy_number)
+
+
+async def _create_scenario_records(scenario: GeneratedScenario) -> None:
+    """Create vehicle then policy records.
+
+    These stay sequential: ``policies.vin`` references ``vehicles.vin``.
+    """
+    try:
+        await _maybe_create_vehicle(scenario)
+    except Exception as e:
+        logger.warning("Could not create vehicle record: %s", e)
+
+    try:
+        await _maybe_create_policy(scenario)
+    except Exception as e:
+        logger.warning("Could not create policy record: %s", e)
+
+
+async def _index_policy(scenario: GeneratedScenario) -> None:
+    """Add the generated policy to the FAISS index for the policy checker agent."""
+    policy_search = get_policy_search()
+    policy_number = scenario.policy.policy_number
+    if policy_search.contains(policy_number):
+        # Saved policies are indexed at startup and generated ones on first use
+        logger.info("Policy %s already in FAISS index, skipping", policy_number)
+        return
+    # claim_type is a string (not enum), so use it directly
+    policy_type = scenario.claim.claim_type.replace("_", " ").title()
+    # Embedding + FAISS add is blocking; keep it off the event loop
+    success = await asyncio.to_thread(
+        policy_search.add_policy_from_text,
+        policy_number=policy_number,
+        policy_type=policy_type,
+        markdown_content=scenario.policy.markdown_content,
+    )
+    if success:
+        logger.info("Added generated policy %s to FAISS index", policy_number)
+    else:
+        logger.warning("Could not add policy %s to FAISS index", policy_number)
 
 
 @router.post(
@@ -62,112 +212,43 @@ async def generate_scenario(
     without needing to be saved first.
     """
     logger.info(
-        f"Generating scenario: locale={request.locale.value}, "
-        f"claim_type={request.claim_type.value}, complexity={request.complexity.value}, "
-        f"custom_description={'yes' if request.custom_description else 'no'}"
+        "Generating scenario: locale=%s, claim_type=%s, complexity=%s, custom_description=%s",
+        request.locale.value,
+        request.claim_type.value,
+        request.complexity.value,
+        "yes" if request.custom_description else "no",
     )
     
     try:
         generator = get_scenario_generator()
         scenario = await generator.generate(request)
         
-        logger.info(f"Generated scenario: {scenario.id} - {scenario.name}")
-        
-        # =====================================================================
-        # Feature 005: Create vehicle record for immediate agent tool access
-        # =====================================================================
-        if scenario.claim.vehicle_info:
-            try:
-                from app.db.vehicle_repo import create_vehicle, get_vehicle_by_vin, VehicleCreate
-                
-                vi = scenario.claim.vehicle_info
-                existing = await get_vehicle_by_vin(vi.vin)
-                if not existing:
-                    vehicle_create = VehicleCreate(
-                        vin=vi.vin,
-                        scenario_id=scenario.id,
-                        policy_number=scenario.claim.policy_number,
-                        make=vi.make,
-                        model=vi.model,
-                        year=vi.year,
-                        license_plate=vi.license_plate,
-                        color=getattr(vi, 'color', None),
-                        vehicle_type=getattr(vi, 'vehicle_type', None),
-                    )
-                    await create_vehicle(vehicle_create)
-                    logger.info(f"Created vehicle record: {vi.vin}")
-            except Exception as e:
-                logger.warning(f"Could not create vehicle record: {e}")
-        
-        # =====================================================================
-        # Feature 005: Create policy record for immediate agent tool access
-        # =====================================================================
-        try:
-            from app.db.policy_repo import create_policy, get_policy_by_policy_number, PolicyCreate
-            
-            existing = await get_policy_by_policy_number(scenario.policy.policy_number)
-            if not existing:
-                # Extract coverage info from generated policy
-                policy = scenario.policy
-                customer_info = scenario.claim.customer_info
-                vehicle_info = scenario.claim.vehicle_info
-                
-                policy_create = PolicyCreate(
-                    policy_number=policy.policy_number,
-                    scenario_id=scenario.id,
-                    policy_type=policy.policy_type,
-                    coverage_types=policy.coverage_types,
-                    coverage_limits={
-                        "collision": policy.coverage_limits.collision,
-                        "comprehensive": policy.coverage_limits.comprehensive,
-                        "liability": policy.coverage_limits.liability_per_accident,
-                    },
-                    deductible=policy.deductibles.collision,
-                    premium=policy.premium_amount,
-                    effective_date=policy.effective_date,
-                    expiration_date=policy.expiration_date,
-                    customer_name=customer_info.name if customer_info else scenario.claim.claimant_name,
-                    customer_email=customer_info.email if customer_info else None,
-                    customer_phone=customer_info.phone if customer_info else None,
-                    vin=vehicle_info.vin if vehicle_info else None,
-                )
-                await create_policy(policy_create)
-                logger.info(f"Created policy record: {policy.policy_number}")
-        except Exception as e:
-            logger.warning(f"Could not create policy record: {e}")
+        logger.info("Generated scenario: %s - %s", scenario.id, scenario.name)
         
         # =====================================================================
-        # Add generated policy to FAISS index for policy checker agent
-        # This enables semantic search for coverage information
+        # Feature 005: Make the scenario immediately usable by agent tools.
+        # DB records and FAISS indexing are independent, so run them together.
         # =====================================================================
-        try:
-            policy_search = get_policy_search()
-            policy_number = scenario.policy.policy_number
-            # claim_type is a string (not enum), so use it directly
-            policy_type = scenario.claim.claim_type.replace("_", " ").title()
-            success = policy_search.add_policy_from_text(
-                policy_number=policy_number,
-                policy_type=policy_type,
-                markdown_content=scenario.policy.markdown_content,
-            )
-            if success:
-                logger.info(f"Added generated policy {policy_number} to FAISS index")
-            else:
-                logger.warning(f"Could not add policy {policy_number} to FAISS index")
-        except Exception as e:
-            # Don't fail the request if FAISS indexing fails
-            logger.warning(f"Failed to add policy to FAISS index: {e}")
+        results = await asyncio.gather(
+            _create_scenario_records(scenario),
+            _index_policy(scenario),
+            return_exceptions=True,
+        )
+        for result in results:
+            if isinstance(result, Exception):
+                # Don't fail the request if a side effect fails
+                logger.warning("Scenario side effect failed: %s", result)
         
         return scenario
         
     except ValueError as e:
-        logger.error(f"Generation failed: {e}")
+        logger.error("Generation failed: %s", e)
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail={"error": "generation_failed", "message": str(e)},
         )
-    except Exception as e:
-        logger.exception(f"Unexpected error during generation: {e}")
+    except Exception:
+        logger.exception("Unexpected error during generation")
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail={"error": "internal_error", "message": "An unexpected error occurred"},
@@ -185,19 +266,18 @@ async def list_scenarios(
     claim_type: Optional[ClaimType] = None,
     limit: int = 50,
     offset: int = 0,
+    repo: ScenarioRepository = Depends(get_scenario_repo),
 ) -> ScenarioListResponse:
     """List saved scenarios with optional filtering."""
     if limit > 100:
         limit = 100
     
-    async with get_db_connection() as db:
-        repo = ScenarioRepository(db)
-        return await repo.list(
-            locale=locale,
-            claim_type=claim_type,
-            limit=limit,
-            offset=offset,
-        )
+    return await repo.list(
+        locale=locale,
+        claim_type=claim_type,
+        limit=limit,
+        offset=offset,
+    )
 
 
 @router.post(
@@ -212,34 +292,32 @@ async def list_scenarios(
 )
 async def save_scenario(
     request: SaveScenarioRequest,
+    repo: ScenarioRepository = Depends(get_scenario_repo),
 ) -> SavedScenarioSummary:
     """Save a generated scenario to the database.
     
     Also creates vehicle and policy records for workflow agent lookups.
     """
-    from app.db.vehicle_repo import VehicleCreate, create_vehicle
-    from app.db.policy_repo import PolicyCreate, create_policy
-    
-    logger.info(f"Saving scenario: {request.name}")
-    
-    async with get_db_connection() as db:
-        repo = ScenarioRepository(db)
-        
-        # Check if scenario already exists
-        if await repo.exists(request.scenario.id):
-            raise HTTPException(
-                status_code=status.HTTP_400_BAD_REQUEST,
-                detail={"error": "already_exists", "message": "Scenario with this ID already exists"},
-            )
-        
-        result = await repo.create(request.scenario, request.name)
+    logger.info("Saving scenario: %s", request.name)
     
-    # Create vehicle record if this is an auto claim with vehicle info (T011)
+    # Insert and existence check in one round-trip; None means the ID is taken
+    result = await repo.create_if_not_exists(request.scenario, request.name)
+    if result is None:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail={"error": "already_exists", "message": "Scenario with this ID already exists"},
+        )
+
+    # Vehicle/policy records reuse this connection and stay sequential:
+    # policies.vin references vehicles.vin.
     scenario = request.scenario
+
+    # Create vehicle record if this is an auto claim with vehicle info (T011)
     if scenario.claim.vehicle_info:
         try:
             vi = scenario.claim.vehicle_info
-            vehicle_create = VehicleCreate(
+            # Built from the already-validated request model, so skip re-validation
+            vehicle_create = VehicleCreate.model_construct(
                 vin=vi.vin,
                 scenario_id=scenario.id,
                 policy_number=scenario.policy.policy_number,
@@ -247,32 +325,28 @@ async def save_scenario(
                 model=vi.model,
                 year=vi.year,
                 license_plate=vi.license_plate,
+                color=vi.color,
+                vehicle_type=vi.vehicle_type,
             )
-            await create_vehicle(vehicle_create)
-            logger.info(f"Created vehicle record: VIN={vi.vin}")
+            if await upsert_vehicle(vehicle_create, conn=repo.db):
+                logger.info("Created vehicle record: VIN=%s", vi.vin)
+            else:
+                logger.info("Vehicle record already exists: VIN=%s", vi.vin)
         except Exception as e:
             # Don't fail the save if vehicle creation fails
-            logger.warning(f"Failed to create vehicle record: {e}")
-    
+            await repo.db.rollback()
+            logger.warning("Failed to create vehicle record: %s", e)
+
     # Create policy record for workflow lookups (T012)
     try:
         policy = scenario.policy
-        limits = policy.coverage_limits
-        coverage_limits_dict = {
-            "collision": limits.collision,
-            "comprehensive": limits.comprehensive,
-            "liability_per_person": limits.liability_per_person,
-            "liability_per_accident": limits.liability_per_accident,
-            "property_damage": limits.property_damage,
-            "medical_payments": limits.medical_payments,
-        }
-        coverage_types = list(coverage_limits_dict.keys())
-        
-        policy_create = PolicyCreate(
+        coverage_limits_dict = policy.coverage_limits.limits_dict
+
+        policy_create = PolicyCreate.model_construct(
             policy_number=policy.policy_number,
             scenario_id=scenario.id,
             policy_type=policy.policy_type,
-            coverage_types=coverage_types,
+            coverage_types=_COVERAGE_TYPES,
             coverage_limits=coverage_limits_dict,
             deductible=policy.deductibles.collision,
             premium=1200.0,  # Default premium for demo
@@ -283,11 +357,14 @@ async def save_scenario(
             customer_phone=scenario.claim.customer_info.phone if scenario.claim.customer_info else None,
             vin=scenario.claim.vehicle_info.vin if scenario.claim.vehicle_info else None,
         )
-        await create_policy(policy_create)
-        logger.info(f"Created policy record: {policy.policy_number}")
+        if await upsert_policy(policy_create, conn=repo.db):
+            logger.info("Created policy record: %s", policy.policy_number)
+        else:
+            logger.info("Policy record already exists: %s", policy.policy_number)
     except Exception as e:
         # Don't fail the save if policy creation fails
-        logger.warning(f"Failed to create policy record: {e}")
+        await repo.db.rollback()
+        logger.warning("Failed to create policy record: %s", e)
     
     return result
 
@@ -298,8 +375,13 @@ async def save_scenario(
     summary="Get preset scenario templates",
     description="Retrieve list of preset regional templates for quick scenario generation",
 )
-async def get_templates() -> TemplateListResponse:
+async def get_templates(request: Request, response: Response) -> TemplateListResponse:
     """Get the list of preset templates."""
+    etag = _templates_etag()
+    if _etag_matches(request, etag):
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers={"ETag": etag})
+
+    response.headers["ETag"] = etag
     generator = get_scenario_generator()
     return TemplateListResponse(templates=generator.get_templates())
 
@@ -314,29 +396,37 @@ async def get_templates() -> TemplateListResponse:
     description="Retrieve full details of a saved scenario",
 )
 async def get_scenario(
-    scenario_id: str,
+    scenario_id: UUID,
+    request: Request,
+    response: Response,
+    repo: ScenarioRepository = Depends(get_scenario_repo),
 ) -> SavedScenario:
-    """Get a saved scenario by ID."""
-    # Validate UUID format
-    try:
-        UUID(scenario_id)
-    except ValueError:
+    """Get a saved scenario by ID.
+
+    Responses carry an ETag; a matching ``If-None-Match`` gets a 304 after a
+    version-only lookup, without loading the scenario document.
+    """
+    if request.headers.get("if-none-match"):
+        version = await repo.get_version(str(scenario_id))
+        if version is not None:
+            etag = _scenario_etag(scenario_id, version)
+            if _etag_matches(request, etag):
+                return Response(
+                    status_code=status.HTTP_304_NOT_MODIFIED,
+                    headers={"ETag": etag},
+                )
+
+    found = await repo.get_by_id_with_version(str(scenario_id))
+
+    if not found:
         raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail={"error": "invalid_id", "message": "Invalid scenario ID format"},
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail={"error": "not_found", "message": "Scenario not found"},
         )
-    
-    async with get_db_connection() as db:
-        repo = ScenarioRepository(db)
-        scenario = await repo.get_by_id(scenario_id)
-        
-        if not scenario:
-            raise HTTPException(
-                status_code=status.HTTP_404_NOT_FOUND,
-                detail={"error": "not_found", "message": "Scenario not found"},
-            )
-        
-        return scenario
+
+    scenario, version = found
+    response.headers["ETag"] = _scenario_etag(scenario_id, version)
+    return scenario
 
 
 @router.delete(
@@ -349,34 +439,21 @@ async def get_scenario(
     description="Remove a saved scenario from the database",
 )
 async def delete_scenario(
-    scenario_id: str,
+    scenario_id: UUID,
+    repo: ScenarioRepository = Depends(get_scenario_repo),
 ) -> None:
-    """Delete a saved scenario."""
-    from app.db.vehicle_repo import delete_vehicle_by_scenario_id
-    from app.db.policy_repo import delete_policy_by_scenario_id
-    
-    # Validate UUID format
-    try:
-        UUID(scenario_id)
-    except ValueError:
+    """Delete a saved scenario.
+
+    The scenario's vehicle and policy records are removed in the same
+    statement via the ``ON DELETE CASCADE`` foreign keys on ``scenario_id``.
+    """
+    deleted = await repo.delete(str(scenario_id))
+
+    if not deleted:
         raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail={"error": "invalid_id", "message": "Invalid scenario ID format"},
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail={"error": "not_found", "message": "Scenario not found"},
         )
-    
-    async with get_db_connection() as db:
-        repo = ScenarioRepository(db)
-        deleted = await repo.delete(scenario_id)
-        
-        if not deleted:
-            raise HTTPException(
-                status_code=status.HTTP_404_NOT_FOUND,
-                detail={"error": "not_found", "message": "Scenario not found"},
-            )
-    
-    # Also clean up vehicle and policy records
-    await delete_vehicle_by_scenario_id(scenario_id)
-    await delete_policy_by_scenario_id(scenario_id)
 
 
 # =============================================================================
@@ -394,8 +471,6 @@ async def delete_scenario(
 )
 async def get_vehicle_by_vin(vin: str) -> dict:
     """Get vehicle details by VIN."""
-    from app.db.vehicle_repo import get_vehicle_by_vin as repo_get_vehicle
-    
     vehicle = await repo_get_vehicle(vin)
     if not vehicle:
         raise HTTPException(
@@ -417,8 +492,6 @@ async def get_vehicle_by_vin(vin: str) -> dict:
 )
 async def get_policy_by_number(policy_number: str) -> dict:
     """Get policy details by policy number."""
-    from app.db.policy_repo import get_policy_by_policy_number
-    
     policy = await get_policy_by_policy_number(policy_number)
     if not policy:
         raise HTTPException(
@@ -437,7 +510,5 @@ async def get_policy_by_number(policy_number: str) -> dict:
 )
 async def check_policy_coverage(policy_number: str, coverage_type: str) -> dict:
     """Quick coverage check for Policy Checker agent."""
-    from app.db.policy_repo import check_coverage
-    
     result = await check_coverage(policy_number, coverage_type)
     return result
@@ -3,147 +3,118 @@ from __future__ import annotations
 
 import logging
 from fastapi import APIRouter, HTTPException
+from fastapi.responses import StreamingResponse
+import orjson
 import re
-from typing import Any
+from types import MappingProxyType
+from typing import Any, AsyncIterator
 
-from app.models.claim import ClaimIn, ClaimOut, AgentOutputOut, ToolCallOut
+from app.models.claim import ClaimIn, ClaimOut, AgentOutputOut
 from app.services.claim_processing import run as run_workflow
+from app.workflow import process_claim_with_supervisor_stream
 from app.sample_data import ALL_SAMPLE_CLAIMS
-from typing import Dict, List, Optional
+from typing import Dict, List
 
-# Feature 005: Import vehicle/policy repos for generated scenario support
-from app.db.vehicle_repo import create_vehicle, get_vehicle_by_vin, VehicleCreate
-from app.db.policy_repo import create_policy, get_policy_by_policy_number, PolicyCreate
+# Feature 005: Create vehicle/policy records for generated scenario support
+from app.services.claim_data_helpers import ensure_claim_records
 
 logger = logging.getLogger(__name__)
 
 router = APIRouter(tags=["workflow"])
 
-# Regex compiled once - captures various decision outcomes from the synthesizer
-DECISION_PATTERN = re.compile(
-    r"\b(APPROVED|DENIED|REQUIRES_INVESTIGATION|INVESTIGATE|COVERED|NOT_COVERED|PARTIALLY_COVERED)\b", re.IGNORECASE)
-
+# Sample claims keyed by claim_id (static, so built once and kept read-only)
+SAMPLE_CLAIMS_BY_ID = MappingProxyType({claim["claim_id"]: claim for claim in ALL_SAMPLE_CLAIMS})
+AVAILABLE_SAMPLE_IDS = tuple(SAMPLE_CLAIMS_BY_ID)
+# 404 detail suffix listing the sample IDs, formatted once
+_AVAILABLE_SAMPLE_IDS_HINT = f"Available sample claim IDs: {list(AVAILABLE_SAMPLE_IDS)}"
 
-async def _ensure_vehicle_exists(claim_data: dict) -> None:
-    """Ensure vehicle info from claim is available in vehicle_repo for tool lookup.
-    
-    Feature 005: For generated but unsaved scenarios, the vehicle info
-    is in the claim data but not in the database. This ensures agent tools
-    like get_vehicle_details can find the vehicle.
-    """
-    vehicle_info = claim_data.get("vehicle_info")
-    if not vehicle_info:
-        return
-    
-    vin = vehicle_info.get("vin")
-    if not vin:
-        return
-    
-    # Check if vehicle already exists
-    existing = await get_vehicle_by_vin(vin)
-    if existing:
-        logger.debug(f"Vehicle {vin} already exists in repo")
-        return
-    
-    # Create the vehicle record from claim data
-    # Use claim_id as scenario_id for temporary records
-    try:
-        vehicle_create = VehicleCreate(
-            vin=vin,
-            scenario_id=claim_data.get("claim_id", "temp"),
-            policy_number=claim_data.get("policy_number", "unknown"),
-            make=vehicle_info.get("make", "Unknown"),
-            model=vehicle_info.get("model", "Unknown"),
-            year=vehicle_info.get("year", 2020),
-            license_plate=vehicle_info.get("license_plate", ""),
-            color=vehicle_info.get("color"),
-            vehicle_type=vehicle_info.get("vehicle_type"),
-        )
-        await create_vehicle(vehicle_create)
-        logger.info(f"Created vehicle record for generated scenario: {vin}")
-    except Exception as e:
-        logger.warning(f"Could not create vehicle record: {e}")
+# Response for GET /workflow/sample-claims; the samples never change at runtime
+SAMPLE_CLAIMS_SUMMARY = {
+    "available_claims": [
+        {
+            "claim_id": claim.get("claim_id"),
+            "claimant_name": claim.get("claimant_name"),
+            "claim_type": claim.get("claim_type"),
+            "estimated_damage": claim.get("estimated_damage"),
+            "description": claim.get("description", ""),
+        }
+        for claim in ALL_SAMPLE_CLAIMS
+    ],
+    "usage": "Use POST /api/v1/workflow/run with {'claim_id': 'CLM-2026-001'} to process a sample claim",
+}
+
+# Regex compiled once - captures various decision outcomes from the synthesizer.
+# The *COVERED variants share one branch so each position tries fewer alternatives.
+DECISION_PATTERN = re.compile(
+    r"\b(APPROVED|DENIED|REQUIRES_INVESTIGATION|INVESTIGATE|(?:NOT_|PARTIALLY_)?COVERED)\b", re.IGNORECASE)
+# Substrings every DECISION_PATTERN match contains; a cheap gate before the regex
+_DECISION_KEYWORDS = ("APPROVED", "DENIED", "INVESTIGAT", "COVERED")
+# Case-sensitive variant run over already upper-cased text, so the match needs
+# no further normalization
+_DECISION_SEARCH_UPPER = re.compile(DECISION_PATTERN.pattern).search
 
 
-async def _ensure_policy_exists(claim_data: dict) -> None:
-    """Ensure policy from claim is available in policy_repo for tool lookup.
-    
-    Feature 005: For generated but unsaved scenarios, the policy data
-    may need to be available for the Policy Checker agent.
-    """
-    policy_number = claim_data.get("policy_number")
-    if not policy_number:
-        return
-    
-    # Check if policy already exists
-    existing = await get_policy_by_policy_number(policy_number)
-    if existing:
-        logger.debug(f"Policy {policy_number} already exists in repo")
-        return
-    
-    # For workflow demos, we create a policy record from claim data
-    # Use claim_id as scenario_id for temporary records
-    try:
-        # Extract customer info if available
-        customer_info = claim_data.get("customer_info", {})
-        vehicle_info = claim_data.get("vehicle_info", {})
-        
-        policy_create = PolicyCreate(
-            policy_number=policy_number,
-            scenario_id=claim_data.get("claim_id", "temp"),
-            policy_type="Auto",
-            coverage_types=["collision", "comprehensive", "liability"],
-            coverage_limits={
-                "collision": 50000.0,
-                "comprehensive": 50000.0,
-                "liability": 100000.0,
-            },
-            deductible=500.0,
-            premium=1200.0,
-            effective_date=claim_data.get("incident_date", "2026-01-01"),
-            expiration_date="2026-12-31",
-            customer_name=claim_data.get("claimant_name", customer_info.get("name", "Unknown")),
-            customer_email=customer_info.get("email"),
-            customer_phone=customer_info.get("phone"),
-            vin=vehicle_info.get("vin"),
-        )
-        await create_policy(policy_create)
-        logger.info(f"Created policy record for generated scenario: {policy_number}")
-    except Exception as e:
-        logger.warning(f"Could not create policy record: {e}")
+def _find_decision(content: str) -> str | None:
+    """Return the first decision keyword in ``content``, upper-cased."""
+    upper = content.upper()
+    if not any(keyword in upper for keyword in _DECISION_KEYWORDS):
+        return None
+    match = _DECISION_SEARCH_UPPER(upper)
+    return match.group(1) if match else None
 
 
 def get_sample_claim_by_id(claim_id: str) -> dict:
-    """Retrieve sample claim data by claim_id."""
-    for claim in ALL_SAMPLE_CLAIMS:
-        if claim.get("claim_id") == claim_id:
-            return claim
+    """Retrieve sample claim data by claim_id.
+
+    Returns a shallow copy so callers can merge overrides without mutating
+    the shared sample.
+    """
+    claim = SAMPLE_CLAIMS_BY_ID.get(claim_id)
+    if claim is not None:
+        return dict(claim)
 
     # If not found, list available claim IDs
-    available_ids = [claim.get("claim_id") for claim in ALL_SAMPLE_CLAIMS]
     raise HTTPException(
         status_code=404,
-        detail=f"Claim ID '{claim_id}' not found. Available sample claim IDs: {available_ids}"
+        detail=f"Claim ID '{claim_id}' not found. {_AVAILABLE_SAMPLE_IDS_HINT}"
     )
 
 
 @router.get("/workflow/sample-claims")
 async def list_sample_claims():
     """List all available sample claims for testing."""
-    claims_summary = []
-    for claim in ALL_SAMPLE_CLAIMS:
-        claims_summary.append({
-            "claim_id": claim.get("claim_id"),
-            "claimant_name": claim.get("claimant_name"),
-            "claim_type": claim.get("claim_type"),
-            "estimated_damage": claim.get("estimated_damage"),
-            "description": claim.get("description", "")
-        })
+    return SAMPLE_CLAIMS_SUMMARY
 
-    return {
-        "available_claims": claims_summary,
-        "usage": "Use POST /api/v1/workflow/run with {'claim_id': 'CLM-2026-001'} to process a sample claim"
-    }
+
+def _resolve_claim_data(claim: ClaimIn) -> dict:
+    """Decide whether to load a sample claim or use the provided data.
+
+    Accepts either:
+    - A claim_id to load sample data: {"claim_id": "CLM-2026-001"}
+    - Full claim data: {"claim_id": "...", "policy_number": "...", ...}
+    """
+    # Check if this is a sample claim request (only claim_id provided)
+    # or a full claim data request (other fields like policy_number, claimant_name provided)
+    # Dump the request once and reuse it in every branch below
+    claim_dict = claim.to_dict()
+    if claim.is_sample_claim_request():
+        # Only claim_id provided - look up in sample claims
+        return get_sample_claim_by_id(claim.claim_id)
+    if claim.claim_id and claim.policy_number:
+        # Full claim data provided (e.g., from generated scenarios)
+        return claim_dict
+    if claim.claim_id:
+        # claim_id with some overrides - try to load sample and merge
+        try:
+            claim_data = get_sample_claim_by_id(claim.claim_id)
+        except HTTPException:
+            # claim_id not found in samples - use provided data as-is
+            return claim_dict
+        # Merge/override with any additional fields supplied in request
+        claim_data.update({k: v for k, v in claim_dict.items() if k != "claim_id"})
+        return claim_data
+    # Full claim provided without claim_id
+    return claim_dict
 
 
 @router.post("/workflow/run", response_model=ClaimOut)
@@ -159,114 +130,24 @@ async def workflow_run(claim: ClaimIn):  # noqa: D401
         # ------------------------------------------------------------------
         # 1. Decide whether to load sample claim or use provided data
         # ------------------------------------------------------------------
-        # Check if this is a sample claim request (only claim_id provided)
-        # or a full claim data request (other fields like policy_number, claimant_name provided)
-        if claim.is_sample_claim_request():
-            # Only claim_id provided - look up in sample claims
-            claim_data = get_sample_claim_by_id(claim.claim_id)
-        elif claim.claim_id and claim.policy_number:
-            # Full claim data provided (e.g., from generated scenarios)
-            claim_data = claim.to_dict()
-        elif claim.claim_id:
-            # claim_id with some overrides - try to load sample and merge
-            try:
-                claim_data = get_sample_claim_by_id(claim.claim_id)
-                # Merge/override with any additional fields supplied in request
-                override_data = {
-                    k: v for k, v in claim.model_dump(by_alias=True, exclude_none=True).items()
-                    if k != "claim_id"
-                }
-                claim_data.update(override_data)
-            except HTTPException:
-                # claim_id not found in samples - use provided data as-is
-                claim_data = claim.to_dict()
-        else:
-            # Full claim provided without claim_id
-            claim_data = claim.to_dict()
+        claim_data = _resolve_claim_data(claim)
 
         # ------------------------------------------------------------------
         # 1.5 Feature 005: Ensure vehicle/policy exist for generated scenarios
         # ------------------------------------------------------------------
         # For generated but unsaved scenarios, create temporary records
         # so agent tools can find them during processing
-        await _ensure_vehicle_exists(claim_data)
-        await _ensure_policy_exists(claim_data)
+        await ensure_claim_records(claim_data)
 
         # ------------------------------------------------------------------
         # 2. Execute workflow; capture both grouped & chronological
         # ------------------------------------------------------------------
-        chronological: list[dict[str, str]] = []
-        seen_lengths: dict[str, int] = {}
-        agent_outputs: Dict[str, AgentOutputOut] = {}  # NEW: collect structured outputs
-
         # Run the async workflow and get all chunks
         chunks = await run_workflow(claim_data)
-
-        # Process each chunk (agent output)
-        for chunk in chunks:
-            # Process each node in the chunk (now we get individual agent updates)
-            for node_name, node_data in chunk.items():
-                if node_name == "__end__":
-                    continue
-
-                # Extract structured_output if present (T006)
-                structured_output = None
-                if isinstance(node_data, dict):
-                    structured_output = node_data.get("structured_output")
-
-                # Handle different data structures
-                if isinstance(node_data, list):
-                    msgs = node_data
-                elif isinstance(node_data, dict) and "messages" in node_data:
-                    msgs = node_data["messages"]
-                elif isinstance(node_data, dict) and set(node_data.keys()) == {"messages"}:
-                    # Handle supervisor-style single messages key
-                    msgs = node_data["messages"]
-                else:
-                    continue
-
-                prev_len = seen_lengths.get(node_name, 0)
-                new_msgs = msgs[prev_len:]
-
-                for msg in new_msgs:
-                    chronological.append(_serialize_msg(node_name, msg))
-
-                seen_lengths[node_name] = len(msgs)
-                
-                # Collect structured output for this agent (T006)
-                if structured_output is not None:
-                    # Get raw text from last assistant message as fallback
-                    raw_text = None
-                    for msg in reversed(msgs):
-                        msg_role = msg.get("role", "") if isinstance(msg, dict) else getattr(msg, "role", "")
-                        if isinstance(msg_role, dict):
-                            msg_role = msg_role.get("value", "")
-                        if msg_role == "assistant":
-                            msg_content = msg.get("content", "") if isinstance(msg, dict) else getattr(msg, "content", "")
-                            raw_text = str(msg_content)[:500] if msg_content else None
-                            break
-                    
-                    agent_outputs[node_name] = AgentOutputOut(
-                        agent_name=node_name,
-                        structured_output=structured_output,
-                        tool_calls=None,  # TODO: extract tool calls in future
-                        raw_text=raw_text
-                    )
-
-        # ------------------------------------------------------------------
-        # 3. Extract final decision from chronological messages
-        # ------------------------------------------------------------------
-        final_decision: str | None = None
-
-        # Extract final decision scanning chronological reverse order
-        for entry in reversed(chronological):
-            match = DECISION_PATTERN.search(entry["content"])
-            if match:
-                final_decision = match.group(1).upper()
-                break
+        chronological, final_decision, agent_outputs = _aggregate_chunks(chunks)
 
         # ------------------------------------------------------------------
-        # 4. Return response with chronological stream and agent_outputs
+        # 3. Return response with chronological stream and agent_outputs
         # ------------------------------------------------------------------
         return ClaimOut(
             success=True,
@@ -275,8 +156,175 @@ async def workflow_run(claim: ClaimIn):  # noqa: D401
             agent_outputs=agent_outputs if agent_outputs else None,  # NEW: include structured outputs
         )
 
-    except Exception as exc:
-        raise HTTPException(status_code=500, detail=str(exc))
+    except HTTPException:
+        # e.g. 404 for an unknown sample claim_id
+        raise
+    except Exception:
+        logger.exception("Workflow run failed for claim %s", claim.claim_id)
+        raise HTTPException(status_code=500, detail="Workflow execution failed")
+
+
+# Same encoding as _dumps_pretty (agent payloads may carry numpy values),
+# minus the indentation: each frame must stay on one line
+_NDJSON_OPTIONS = orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS
+
+
+def _ndjson(frame: dict) -> bytes:
+    return orjson.dumps(frame, default=str, option=_NDJSON_OPTIONS) + b"\n"
+
+
+@router.post("/workflow/stream")
+async def workflow_stream(claim: ClaimIn) -> StreamingResponse:
+    """Run the claim through the workflow, streaming the trace as NDJSON.
+
+    Accepts the same body as ``/workflow/run``. Emits one JSON object per line:
+
+    - ``{"type": "agent_start", "agent_name": ..., "status": ...}``
+    - ``{"type": "message", "node": ..., "role": ..., "content": ...}``
+    - ``{"type": "result", "final_decision": ..., "agent_outputs": {...}}`` last,
+      or ``{"type": "error", "detail": ...}`` if the workflow fails mid-stream
+    """
+    # Resolve and prepare the claim before streaming, so a bad claim_id still
+    # gets a proper 404 instead of an error frame
+    claim_data = _resolve_claim_data(claim)
+    await ensure_claim_records(claim_data)
+
+    async def frames() -> AsyncIterator[bytes]:
+        aggregator = _ChunkAggregator()
+        try:
+            async for event in process_claim_with_supervisor_stream(claim_data):
+                event_type = event.get("event_type")
+                agent_name = event.get("agent_name")
+                if event_type == "agent_start":
+                    yield _ndjson({
+                        "type": "agent_start",
+                        "agent_name": agent_name,
+                        "status": event.get("status"),
+                    })
+                elif event_type == "agent_complete" and agent_name in event:
+                    for node, role, content in aggregator.add({agent_name: event[agent_name]}):
+                        yield _ndjson({"type": "message", "node": node, "role": role, "content": content})
+            # Encoded inside the try so an unserializable output still ends
+            # the stream with an error frame
+            result_frame = _ndjson({
+                "type": "result",
+                "final_decision": aggregator.final_decision,
+                "agent_outputs": {
+                    name: output.model_dump() for name, output in aggregator.agent_outputs.items()
+                },
+            })
+        except Exception:
+            logger.exception("Workflow stream failed for claim %s", claim.claim_id)
+            yield _ndjson({"type": "error", "detail": "Workflow execution failed"})
+            return
+
+        yield result_frame
+
+    return StreamingResponse(frames(), media_type="application/x-ndjson")
+
+
+# ------------------------------------------------------------------
+# Chunk aggregation
+# ------------------------------------------------------------------
+
+
+class _ChunkAggregator:
+    """Incrementally flattens workflow chunks into chronological messages.
+
+    Tracks the final decision and the structured outputs collected per
+    agent as chunks are added.
+    """
+
+    def __init__(self) -> None:
+        self.seen_lengths: dict[str, int] = {}
+        self.last_assistant_text: dict[str, str | None] = {}
+        # Updated as messages arrive; the last message with a decision wins
+        self.final_decision: str | None = None
+        self.agent_outputs: Dict[str, AgentOutputOut] = {}
+
+    def add(self, chunk: dict) -> list[tuple[str, str, str]]:
+        """Ingest one chunk and return its new ``(node, role, content)`` messages."""
+        entries: list[tuple[str, str, str]] = []
+        append = entries.append
+        seen_lengths = self.seen_lengths
+        last_assistant_text = self.last_assistant_text
+
+        # Process each node in the chunk (now we get individual agent updates)
+        for node_name, node_data in chunk.items():
+            if node_name == "__end__":
+                continue
+
+            # Handle different data structures: a bare message list, or a dict
+            # with "messages" and optionally "structured_output" (T006)
+            structured_output = None
+            if isinstance(node_data, list):
+                msgs = node_data
+            elif isinstance(node_data, dict):
+                msgs = node_data.get("messages")
+                if msgs is None:
+                    continue
+                structured_output = node_data.get("structured_output")
+            else:
+                continue
+
+            # Node message lists are cumulative; index past what was already
+            # seen instead of copying the tail with a slice
+            prev_len = seen_lengths.get(node_name, 0)
+            msg_count = len(msgs)
+
+            for i in range(prev_len, msg_count):
+                msg = msgs[i]
+                role, content = _message_parts(msg)
+                append((node_name, role, content))
+                decision = _find_decision(content)
+                if decision:
+                    self.final_decision = decision
+
+                # Track the raw text of the node's latest assistant message
+                is_dict = isinstance(msg, dict)
+                msg_role = msg.get("role", "") if is_dict else getattr(msg, "role", "")
+                if isinstance(msg_role, dict):
+                    msg_role = msg_role.get("value", "")
+                if msg_role == "assistant":
+                    msg_content = msg.get("content", "") if is_dict else getattr(msg, "content", "")
+                    last_assistant_text[node_name] = str(msg_content)[:500] if msg_content else None
+
+            seen_lengths[node_name] = msg_count
+
+            # Collect structured output for this agent (T006), with the last
+            # assistant message as raw-text fallback
+            if structured_output is not None:
+                # All fields come from the workflow already typed (structured
+                # outputs are model_dump() dicts), so skip re-validation
+                self.agent_outputs[node_name] = AgentOutputOut.model_construct(
+                    agent_name=node_name,
+                    structured_output=structured_output,
+                    tool_calls=None,  # TODO: extract tool calls in future
+                    raw_text=last_assistant_text.get(node_name),
+                )
+
+        return entries
+
+
+def _aggregate_chunks(
+    chunks: List[dict],
+) -> tuple[list[dict[str, str]], str | None, Dict[str, AgentOutputOut]]:
+    """Flatten workflow chunks into chronological messages.
+
+    Returns the chronological conversation, the final decision and the
+    structured outputs collected per agent.
+    """
+    aggregator = _ChunkAggregator()
+    # (node, role, content) per message; turned into dicts once at the end
+    entries: list[tuple[str, str, str]] = []
+    for chunk in chunks:
+        entries.extend(aggregator.add(chunk))
+
+    chronological = [
+        {"role": role, "content": content, "node": node}
+        for node, role, content in entries
+    ]
+    return chronological, aggregator.final_decision, aggregator.agent_outputs
 
 
 # ------------------------------------------------------------------
@@ -284,21 +332,40 @@ async def workflow_run(claim: ClaimIn):  # noqa: D401
 # ------------------------------------------------------------------
 
 
+# Tool arguments/results may carry numpy scalars or arrays (serialized natively)
+# and non-string keys; anything else unsupported falls back to str()
+_ORJSON_OPTIONS = orjson.OPT_INDENT_2 | orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS
+
+
+def _dumps_pretty(obj: Any) -> str:
+    return orjson.dumps(obj, default=str, option=_ORJSON_OPTIONS).decode()
+
+
 def _serialize_msg(node: str, msg: Any, *, include_node: bool = True) -> dict:  # noqa: D401
     """Return a serializable dict for a message (supports both LangChain objects and plain dicts)."""
-    import json as json_mod
-    import numpy as np
-    
-    def json_safe(obj):
-        """Convert numpy types to Python native types for JSON serialization."""
-        if isinstance(obj, np.floating):
-            return float(obj)
-        if isinstance(obj, np.integer):
-            return int(obj)
-        if isinstance(obj, np.ndarray):
-            return obj.tolist()
-        return str(obj)
-    
+    role, content = _message_parts(msg)
+    data = {"role": role, "content": content}
+    if include_node:
+        data["node"] = node
+    return data
+
+
+def _message_parts(msg: Any) -> tuple[str, str]:
+    """Return ``(role, content)`` for a message (LangChain object or plain dict)."""
+    # Fast path: most messages are plain {"role": str, "content": str} dicts
+    # with no tool-call structure to unpack
+    if type(msg) is dict:
+        role = msg.get("role")
+        content = msg.get("content")
+        if (
+            type(role) is str
+            and type(content) is str
+            and "contents" not in msg
+            and "tool_calls" not in msg
+            and "tool_call_id" not in msg
+        ):
+            return role, content.strip()
+
     # Handle plain dict messages (from Microsoft Agent Framework)
     if isinstance(msg, dict):
         role = msg.get("role", "assistant")
@@ -321,9 +388,9 @@ def _serialize_msg(node: str, msg: Any, *, include_node: bool = True) -> dict:
                     func_args = item.get("arguments", "{}")
                     content_parts.append(f"🔧 Calling tool: {func_name}")
                     try:
-                        args = json_mod.loads(func_args) if isinstance(func_args, str) else func_args
+                        args = orjson.loads(func_args) if isinstance(func_args, str) else func_args
                         if args:
-                            content_parts.append(f"   Arguments: {json_mod.dumps(args, indent=2, default=json_safe)}")
+                            content_parts.append(f"   Arguments: {_dumps_pretty(args)}")
                     except:
                         pass
                         
@@ -332,7 +399,7 @@ def _serialize_msg(node: str, msg: Any, *, include_node: bool = True) -> dict:
                     func_name = item.get("name", "tool")
                     result = item.get("result", "")
                     if isinstance(result, dict):
-                        result_str = json_mod.dumps(result, indent=2, default=json_safe)
+                        result_str = _dumps_pretty(result)
                     else:
                         result_str = str(result)
                     # Truncate very long tool responses
@@ -365,9 +432,9 @@ def _serialize_msg(node: str, msg: Any, *, include_node: bool = True) -> dict:
                 func_args = func.get("arguments", "{}")
                 tool_info.append(f"🔧 Calling tool: {func_name}")
                 try:
-                    args = json_mod.loads(func_args) if isinstance(func_args, str) else func_args
+                    args = orjson.loads(func_args) if isinstance(func_args, str) else func_args
                     if args:
-                        tool_info.append(f"   Arguments: {json_mod.dumps(args, indent=2, default=json_safe)}")
+                        tool_info.append(f"   Arguments: {_dumps_pretty(args)}")
                 except:
                     pass
             content_repr = "\n".join(tool_info)
@@ -392,10 +459,4 @@ def _serialize_msg(node: str, msg: Any, *, include_node: bool = True) -> dict:
         else:
             content_repr = getattr(msg, "content", str(msg)) or ""
 
-    data = {
-        "role": role,
-        "content": content_repr.strip() if isinstance(content_repr, str) else str(content_repr),
-    }
-    if include_node:
-        data["node"] = node
-    return data
+    return role, content_repr.strip() if isinstance(content_repr, str) else str(content_repr)
@@ -21,6 +21,7 @@ class Settings(BaseSettings):  # noqa: D101
     database_url: str = Field(alias="DATABASE_URL")
     database_pool_size: int = Field(default=5, alias="DATABASE_POOL_SIZE")
     database_max_overflow: int = Field(default=10, alias="DATABASE_MAX_OVERFLOW")
+    database_pool_recycle: int = Field(default=1800, alias="DATABASE_POOL_RECYCLE")
     test_database_url: str | None = Field(default=None, alias="TEST_DATABASE_URL")
 
     # Azure OpenAI (auth via DefaultAzureCredential — no API key needed)
@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 import asyncio
+import functools
 import logging
 from contextlib import asynccontextmanager
 from datetime import datetime, timezone
@@ -11,7 +12,9 @@ from typing import Any, AsyncGenerator, Mapping
 
 from alembic import command
 from alembic.config import Config as AlembicConfig
-from sqlalchemy import text
+from alembic.script import ScriptDirectory
+import orjson
+from sqlalchemy import TextClause, text
 from sqlalchemy.engine import RowMapping
 from sqlalchemy.ext.asyncio import AsyncConnection, AsyncEngine, create_async_engine
 
@@ -27,9 +30,12 @@ BOOTSTRAP_LOCK_ID = 941_205
 APP_TABLES = [
     "claim_audit_log",
     "claim_decisions",
+    "claim_status_counts",
+    "handler_decision_counts",
     "ai_assessments",
     "claims",
     "handlers",
+    "policy_coverage",
     "policies",
     "vehicles",
     "saved_scenarios",
@@ -63,6 +69,10 @@ DEMO_HANDLERS = [
 ]
 
 
+def _json_dumps(value: Any) -> str:
+    return orjson.dumps(value).decode()
+
+
 def get_engine() -> AsyncEngine:
     """Return the shared async SQLAlchemy engine."""
     global _engine
@@ -74,6 +84,10 @@ def get_engine() -> AsyncEngine:
             pool_pre_ping=True,
             pool_size=settings.database_pool_size,
             max_overflow=settings.database_max_overflow,
+            pool_recycle=settings.database_pool_recycle,
+            # asyncpg decodes json/jsonb columns in the driver; use orjson there
+            json_serializer=_json_dumps,
+            json_deserializer=orjson.loads,
         )
 
     return _engine
@@ -91,6 +105,25 @@ def _run_alembic_upgrade() -> None:
     command.upgrade(_get_alembic_config(), "head")
 
 
+@functools.lru_cache(maxsize=1)
+def _alembic_head() -> str | None:
+    return ScriptDirectory.from_config(_get_alembic_config()).get_current_head()
+
+
+async def _is_at_head(connection: AsyncConnection) -> bool:
+    """Return True when the database is already stamped with the head revision."""
+    has_version_table = (
+        await connection.execute(text("SELECT to_regclass('alembic_version') IS NOT NULL"))
+    ).scalar_one()
+    if not has_version_table:
+        return False
+
+    current = (
+        await connection.execute(text("SELECT version_num FROM alembic_version"))
+    ).scalar_one_or_none()
+    return current is not None and current == await asyncio.to_thread(_alembic_head)
+
+
 async def seed_demo_handlers(connection: AsyncConnection) -> None:
     """Ensure demo handlers exist for workbench flows."""
     payload = [
@@ -113,6 +146,16 @@ async def seed_demo_handlers(connection: AsyncConnection) -> None:
     await connection.commit()
 
 
+async def _warm_pool(engine: AsyncEngine, size: int) -> None:
+    """Open ``size`` pooled connections up front so requests don't pay for them."""
+
+    async def _checkout() -> None:
+        async with engine.connect() as connection:
+            await connection.execute(text("SELECT 1"))
+
+    await asyncio.gather(*(_checkout() for _ in range(size)))
+
+
 async def init_db() -> None:
     """Run migrations and seed baseline data exactly once per process."""
     global _is_initialized
@@ -132,7 +175,9 @@ async def init_db() -> None:
                 {"lock_id": BOOTSTRAP_LOCK_ID},
             )
             try:
-                await asyncio.to_thread(_run_alembic_upgrade)
+                # Upgrading spins up its own engine; skip it when already current
+                if not await _is_at_head(connection):
+                    await asyncio.to_thread(_run_alembic_upgrade)
                 await seed_demo_handlers(connection)
             finally:
                 await connection.execute(
@@ -141,6 +186,7 @@ async def init_db() -> None:
                 )
                 await connection.commit()
 
+        await _warm_pool(engine, get_settings().database_pool_size)
         _is_initialized = True
         logger.info("Database initialized successfully")
 
@@ -153,20 +199,41 @@ async def get_db() -> AsyncGenerator[AsyncConnection, None]:
 
 
 @asynccontextmanager
-async def get_db_connection() -> AsyncGenerator[AsyncConnection, None]:
-    """Context manager around a PostgreSQL connection."""
+async def get_db_connection(
+    connection: AsyncConnection | None = None,
+) -> AsyncGenerator[AsyncConnection, None]:
+    """Context manager around a PostgreSQL connection.
+
+    Pass an already-open ``connection`` to reuse it instead of checking out
+    another one from the pool.
+    """
+    if connection is not None:
+        yield connection
+        return
+
     await init_db()
     async with get_engine().connect() as connection:
         yield connection
 
 
+@functools.lru_cache(maxsize=512)
+def _compiled_text(query: str) -> TextClause:
+    """Parse a SQL string into a TextClause once and reuse it.
+
+    The repositories pass module-level (or per-shape cached) query strings,
+    so this skips re-scanning them for bind parameters on every call. The
+    statement itself is prepared and cached per connection by asyncpg.
+    """
+    return text(query)
+
+
 async def fetch_one(
     connection: AsyncConnection,
     query: str,
     params: Mapping[str, Any] | None = None,
 ) -> RowMapping | None:
     """Execute a text query and return a single row mapping."""
-    result = await connection.execute(text(query), params or {})
+    result = await connection.execute(_compiled_text(query), params or {})
     return result.mappings().one_or_none()
 
 
@@ -176,7 +243,7 @@ async def fetch_all(
     params: Mapping[str, Any] | None = None,
 ) -> list[RowMapping]:
     """Execute a text query and return all rows as mappings."""
-    result = await connection.execute(text(query), params or {})
+    result = await connection.execute(_compiled_text(query), params or {})
     return list(result.mappings().all())
 
 
@@ -190,6 +257,12 @@ async def truncate_all_tables(connection: AsyncConnection) -> None:
         )
     )
     await connection.commit()
+
+    # Imported here on purpose: policy_repo imports this module at load time,
+    # so a module-level import would be circular
+    from app.db.policy_repo import invalidate_policy_cache
+
+    invalidate_policy_cache()
     await seed_demo_handlers(connection)
 
 
@@ -2,18 +2,83 @@
 
 from __future__ import annotations
 
-import json
 import logging
+import threading
+import time
+from collections import OrderedDict
 from datetime import datetime, timezone
-from typing import Optional
+from functools import cached_property
+from typing import AsyncIterator, Optional, Sequence
 
-from pydantic import BaseModel
+import orjson
+from pydantic import BaseModel, ConfigDict
 from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncConnection
 
-from app.db.database import fetch_all, fetch_one, get_db_connection
+from app.db.database import _compiled_text, fetch_all, fetch_one, get_db_connection
 
 logger = logging.getLogger(__name__)
 
+# Policies rarely change once saved, but the Policy Checker looks them up on
+# every workflow run. Keep recent lookups in a small TTL-bounded LRU. The lock
+# guards against the workflow tools, which query from a worker thread.
+#
+# The cache lives in each process. invalidate_policy_cache (called on writes,
+# scenario deletes and truncate_all_tables) only clears the calling process,
+# so with several workers another worker can serve a policy up to
+# _POLICY_CACHE_TTL_SECONDS stale after a change. Policy writes only happen
+# when scenarios are saved or deleted, which keeps that window acceptable;
+# lower the TTL if policies start changing under live traffic.
+_POLICY_CACHE_MAXSIZE = 1024
+_POLICY_CACHE_TTL_SECONDS = 300.0
+_policy_cache: OrderedDict[str, tuple[float, "PolicyRecord"]] = OrderedDict()
+_policy_cache_lock = threading.Lock()
+
+
+def _cache_get(policy_number: str) -> Optional["PolicyRecord"]:
+    with _policy_cache_lock:
+        entry = _policy_cache.get(policy_number)
+        if entry is None:
+            return None
+        expires_at, policy = entry
+        if expires_at < time.monotonic():
+            del _policy_cache[policy_number]
+            return None
+        _policy_cache.move_to_end(policy_number)
+        return policy
+
+
+def _cache_put(policy: "PolicyRecord") -> None:
+    with _policy_cache_lock:
+        _policy_cache[policy.policy_number] = (
+            time.monotonic() + _POLICY_CACHE_TTL_SECONDS,
+            policy,
+        )
+        _policy_cache.move_to_end(policy.policy_number)
+        while len(_policy_cache) > _POLICY_CACHE_MAXSIZE:
+            _policy_cache.popitem(last=False)
+
+
+def invalidate_policy_cache(
+    policy_number: Optional[str] = None,
+    scenario_id: Optional[str] = None,
+) -> None:
+    """Drop cached policies by number or owning scenario; clear all if neither is given."""
+    with _policy_cache_lock:
+        if policy_number is None and scenario_id is None:
+            _policy_cache.clear()
+            return
+        if policy_number is not None:
+            _policy_cache.pop(policy_number, None)
+        if scenario_id is not None:
+            stale = [
+                number
+                for number, (_, policy) in _policy_cache.items()
+                if str(policy.scenario_id) == str(scenario_id)
+            ]
+            for number in stale:
+                del _policy_cache[number]
+
 
 def _parse_datetime(value: str) -> datetime:
     normalized = value.replace("Z", "+00:00")
@@ -27,9 +92,16 @@ def _format_policy_date(value: datetime) -> str:
     return value.date().isoformat()
 
 
+_loads = orjson.loads
+
+
+def _dumps(value) -> str:
+    return orjson.dumps(value).decode()
+
+
 def _coerce_json(value):
     if isinstance(value, str):
-        return json.loads(value)
+        return _loads(value)
     return value
 
 
@@ -39,7 +111,7 @@ class PolicyCreate(BaseModel):
     policy_number: str
     scenario_id: str
     policy_type: str
-    coverage_types: list[str]
+    coverage_types: Sequence[str]
     coverage_limits: dict[str, float]
     deductible: float
     premium: float
@@ -54,6 +126,9 @@ class PolicyCreate(BaseModel):
 class PolicyRecord(BaseModel):
     """Policy record from database - used by workflow agents."""
 
+    # Instances are shared through the policy cache, so keep them immutable
+    model_config = ConfigDict(frozen=True)
+
     policy_number: str
     scenario_id: str
     policy_type: str
@@ -69,27 +144,33 @@ class PolicyRecord(BaseModel):
     vin: Optional[str]
     created_at: str
 
+    # Coverage types and limit keys are lower-cased at write time
+    @cached_property
+    def coverage_set(self) -> frozenset[str]:
+        return frozenset(self.coverage_types)
+
     def has_coverage(self, coverage_type: str) -> bool:
-        return coverage_type.lower() in [coverage.lower() for coverage in self.coverage_types]
+        return coverage_type.lower() in self.coverage_set
 
     def get_limit(self, coverage_type: str) -> Optional[float]:
-        if coverage_type in self.coverage_limits:
-            return self.coverage_limits[coverage_type]
-        for key, value in self.coverage_limits.items():
-            if key.lower() == coverage_type.lower():
-                return value
-        return None
+        return self.coverage_limits.get(coverage_type.lower())
+
+
+def _normalized_coverage(policy: PolicyCreate) -> tuple[list[str], dict[str, float]]:
+    return (
+        [coverage.lower() for coverage in policy.coverage_types],
+        {key.lower(): value for key, value in policy.coverage_limits.items()},
+    )
 
 
 def _row_to_policy_record(row) -> PolicyRecord:
-    coverage_types = _coerce_json(row["coverage_types"])
-    coverage_limits = _coerce_json(row["coverage_limits"])
-    return PolicyRecord(
+    # Rows come from our own table, so skip re-validating every field
+    return PolicyRecord.model_construct(
         policy_number=row["policy_number"],
         scenario_id=row["scenario_id"],
         policy_type=row["policy_type"],
-        coverage_types=coverage_types,
-        coverage_limits=coverage_limits,
+        coverage_types=_coerce_json(row["coverage_types"]),
+        coverage_limits=_coerce_json(row["coverage_limits"]),
         deductible=float(row["deductible"]),
         premium=float(row["premium"]),
         effective_date=_format_policy_date(row["effective_date"]),
@@ -102,56 +183,48 @@ def _row_to_policy_record(row) -> PolicyRecord:
     )
 
 
-async def create_policy(policy: PolicyCreate) -> PolicyRecord:
-    """Create a new policy record in the database."""
-    created_at = datetime.now(timezone.utc)
+def _policy_params(policy: PolicyCreate) -> dict:
+    coverage_types, coverage_limits = _normalized_coverage(policy)
+    return {
+        "policy_number": policy.policy_number,
+        "scenario_id": policy.scenario_id,
+        "policy_type": policy.policy_type,
+        "coverage_types": _dumps(coverage_types),
+        "coverage_limits": _dumps(coverage_limits),
+        "deductible": policy.deductible,
+        "premium": policy.premium,
+        "effective_date": _parse_datetime(policy.effective_date),
+        "expiration_date": _parse_datetime(policy.expiration_date),
+        "customer_name": policy.customer_name,
+        "customer_email": policy.customer_email,
+        "customer_phone": policy.customer_phone,
+        "vin": policy.vin,
+    }
 
-    async with get_db_connection() as db:
-        await db.execute(
-            text(
-                """
-                INSERT INTO policies (
-                    policy_number, scenario_id, policy_type, coverage_types,
-                    coverage_limits, deductible, premium, effective_date,
-                    expiration_date, customer_name, customer_email, customer_phone,
-                    vin, created_at
-                ) VALUES (
-                    :policy_number, :scenario_id, :policy_type, CAST(:coverage_types AS jsonb),
-                    CAST(:coverage_limits AS jsonb), :deductible, :premium, :effective_date,
-                    :expiration_date, :customer_name, :customer_email, :customer_phone,
-                    :vin, :created_at
-                )
-                """
-            ),
-            {
-                "policy_number": policy.policy_number,
-                "scenario_id": policy.scenario_id,
-                "policy_type": policy.policy_type,
-                "coverage_types": json.dumps(policy.coverage_types),
-                "coverage_limits": json.dumps(policy.coverage_limits),
-                "deductible": policy.deductible,
-                "premium": policy.premium,
-                "effective_date": _parse_datetime(policy.effective_date),
-                "expiration_date": _parse_datetime(policy.expiration_date),
-                "customer_name": policy.customer_name,
-                "customer_email": policy.customer_email,
-                "customer_phone": policy.customer_phone,
-                "vin": policy.vin,
-                "created_at": created_at,
-            },
-        )
-        await db.commit()
 
-    logger.info("Created policy record: %s", policy.policy_number)
+_INSERT_POLICY_SQL = """
+    INSERT INTO policies (
+        policy_number, scenario_id, policy_type, coverage_types,
+        coverage_limits, deductible, premium, effective_date,
+        expiration_date, customer_name, customer_email, customer_phone, vin
+    ) VALUES (
+        :policy_number, :scenario_id, :policy_type, CAST(:coverage_types AS jsonb),
+        CAST(:coverage_limits AS jsonb), :deductible, :premium, :effective_date,
+        :expiration_date, :customer_name, :customer_email, :customer_phone, :vin
+    )
+"""
 
-    return PolicyRecord(
+
+def _created_record(policy: PolicyCreate, created_at: datetime) -> PolicyRecord:
+    coverage_types, coverage_limits = _normalized_coverage(policy)
+    return PolicyRecord.model_construct(
         policy_number=policy.policy_number,
         scenario_id=policy.scenario_id,
         policy_type=policy.policy_type,
-        coverage_types=policy.coverage_types,
-        coverage_limits=policy.coverage_limits,
-        deductible=policy.deductible,
-        premium=policy.premium,
+        coverage_types=coverage_types,
+        coverage_limits=coverage_limits,
+        deductible=float(policy.deductible),
+        premium=float(policy.premium),
         effective_date=_format_policy_date(_parse_datetime(policy.effective_date)),
         expiration_date=_format_policy_date(_parse_datetime(policy.expiration_date)),
         customer_name=policy.customer_name,
@@ -162,15 +235,131 @@ async def create_policy(policy: PolicyCreate) -> PolicyRecord:
     )
 
 
+# Spell out the columns _row_to_policy_record reads instead of SELECT *, and
+# keep each statement a constant so asyncpg's per-connection prepared
+# statement cache sees identical SQL text on every call.
+_POLICY_COLUMNS = """
+    policy_number, scenario_id, policy_type, coverage_types, coverage_limits,
+    deductible, premium, effective_date, expiration_date, customer_name,
+    customer_email, customer_phone, vin, created_at
+"""
+_UPSERT_POLICY_SQL = (
+    _INSERT_POLICY_SQL + " ON CONFLICT (policy_number) DO NOTHING RETURNING " + _POLICY_COLUMNS
+)
+_CREATE_POLICY_SQL = _INSERT_POLICY_SQL + " RETURNING created_at"
+_SELECT_POLICY_BY_NUMBER_SQL = (
+    "SELECT " + _POLICY_COLUMNS + " FROM policies WHERE policy_number = :policy_number"
+)
+_SELECT_POLICY_BY_SCENARIO_SQL = (
+    "SELECT " + _POLICY_COLUMNS + " FROM policies WHERE scenario_id = :scenario_id"
+)
+_SELECT_ALL_POLICIES_SQL = (
+    "SELECT " + _POLICY_COLUMNS + " FROM policies ORDER BY created_at DESC"
+)
+_DELETE_POLICIES_BY_SCENARIO_SQL = (
+    "DELETE FROM policies WHERE scenario_id = :scenario_id RETURNING policy_number"
+)
+_SELECT_COVERAGE_FIELDS_SQL = """
+    SELECT p.deductible, pc.has_coverage, pc.limit_value
+    FROM policies p
+    LEFT JOIN policy_coverage pc
+        ON pc.policy_number = p.policy_number
+        AND pc.coverage_type = :coverage_type
+    WHERE p.policy_number = :policy_number
+"""
+
+
+async def create_policies_bulk(
+    policies: Sequence[PolicyCreate],
+    conn: Optional[AsyncConnection] = None,
+) -> list[PolicyRecord]:
+    """Insert several policy records in one executemany and a single commit."""
+    if not policies:
+        return []
+
+    async with get_db_connection(conn) as db:
+        await db.execute(
+            text(_INSERT_POLICY_SQL),
+            [_policy_params(policy) for policy in policies],
+        )
+        # created_at defaults to now(), which is fixed for the whole
+        # transaction, so one read gives every row's timestamp
+        created_at = (await db.execute(text("SELECT now()"))).scalar_one()
+        await db.commit()
+
+    records = []
+    for policy in policies:
+        logger.info("Created policy record: %s", policy.policy_number)
+        record = _created_record(policy, created_at)
+        _cache_put(record)
+        records.append(record)
+    return records
+
+
+async def create_policy(
+    policy: PolicyCreate,
+    conn: Optional[AsyncConnection] = None,
+) -> PolicyRecord:
+    """Create a new policy record in the database."""
+    async with get_db_connection(conn) as db:
+        row = await fetch_one(
+            db,
+            _CREATE_POLICY_SQL,
+            _policy_params(policy),
+        )
+        await db.commit()
+
+    logger.info("Created policy record: %s", policy.policy_number)
+    record = _created_record(policy, row["created_at"])
+    _cache_put(record)
+    return record
+
+
+async def upsert_policy(
+    policy: PolicyCreate,
+    conn: Optional[AsyncConnection] = None,
+) -> Optional[PolicyRecord]:
+    """Insert a policy unless one with the same policy number already exists.
+
+    Uses a single ``INSERT ... ON CONFLICT DO NOTHING RETURNING`` round-trip
+    instead of a lookup followed by an insert. Returns the created record, or
+    ``None`` when the policy number was already present.
+    """
+    async with get_db_connection(conn) as db:
+        row = await fetch_one(
+            db,
+            _UPSERT_POLICY_SQL,
+            _policy_params(policy),
+        )
+        await db.commit()
+
+    if row is None:
+        return None
+
+    logger.info("Created policy record: %s", policy.policy_number)
+    record = _row_to_policy_record(row)
+    _cache_put(record)
+    return record
+
+
 async def get_policy_by_policy_number(policy_number: str) -> Optional[PolicyRecord]:
-    """Get a policy by policy number."""
+    """Get a policy by policy number, served from the TTL cache when possible."""
+    cached = _cache_get(policy_number)
+    if cached is not None:
+        return cached
+
     async with get_db_connection() as db:
         row = await fetch_one(
             db,
-            "SELECT * FROM policies WHERE policy_number = :policy_number",
+            _SELECT_POLICY_BY_NUMBER_SQL,
             {"policy_number": policy_number},
         )
-    return _row_to_policy_record(row) if row else None
+    if row is None:
+        return None
+
+    policy = _row_to_policy_record(row)
+    _cache_put(policy)
+    return policy
 
 
 async def get_policy_by_scenario_id(scenario_id: str) -> Optional[PolicyRecord]:
@@ -178,40 +367,84 @@ async def get_policy_by_scenario_id(scenario_id: str) -> Optional[PolicyRecord]:
     async with get_db_connection() as db:
         row = await fetch_one(
             db,
-            "SELECT * FROM policies WHERE scenario_id = :scenario_id",
+            _SELECT_POLICY_BY_SCENARIO_SQL,
             {"scenario_id": scenario_id},
         )
     return _row_to_policy_record(row) if row else None
 
 
+async def iter_all_policies() -> AsyncIterator[PolicyRecord]:
+    """Yield every policy, newest first, through a server-side cursor."""
+    async with get_db_connection() as db:
+        result = await db.stream(_compiled_text(_SELECT_ALL_POLICIES_SQL))
+        async for row in result.mappings():
+            yield _row_to_policy_record(row)
+
+
 async def list_all_policies() -> list[PolicyRecord]:
     """List all policies in the database."""
-    async with get_db_connection() as db:
-        rows = await fetch_all(
-            db,
-            "SELECT * FROM policies ORDER BY created_at DESC",
-        )
-    return [_row_to_policy_record(row) for row in rows]
+    return [policy async for policy in iter_all_policies()]
 
 
 async def delete_policy_by_scenario_id(scenario_id: str) -> bool:
     """Delete the policy associated with a scenario."""
     async with get_db_connection() as db:
-        result = await db.execute(
-            text("DELETE FROM policies WHERE scenario_id = :scenario_id"),
+        rows = await fetch_all(
+            db,
+            _DELETE_POLICIES_BY_SCENARIO_SQL,
             {"scenario_id": scenario_id},
         )
         await db.commit()
-    deleted = result.rowcount > 0
+    for row in rows:
+        invalidate_policy_cache(row["policy_number"])
+    deleted = bool(rows)
     if deleted:
         logger.info("Deleted policy for scenario: %s", scenario_id)
     return deleted
 
 
+async def get_policy_coverage_fields(
+    policy_number: str,
+    coverage_type: str,
+) -> Optional[tuple[bool, Optional[float], float]]:
+    """Return ``(has_coverage, coverage_limit, deductible)`` for one coverage type.
+
+    Reads only those columns from ``policies`` and the trigger-maintained
+    ``policy_coverage`` table. Returns ``None`` when the policy does not exist.
+    """
+    async with get_db_connection() as db:
+        row = await fetch_one(
+            db,
+            _SELECT_COVERAGE_FIELDS_SQL,
+            {"policy_number": policy_number, "coverage_type": coverage_type.lower()},
+        )
+    if row is None:
+        return None
+
+    limit_value = row["limit_value"]
+    return (
+        bool(row["has_coverage"]),
+        float(limit_value) if limit_value is not None else None,
+        float(row["deductible"]),
+    )
+
+
 async def check_coverage(policy_number: str, coverage_type: str) -> dict:
-    """Quick check for coverage type and limit."""
-    policy = await get_policy_by_policy_number(policy_number)
-    if policy is None:
+    """Quick check for coverage type and limit.
+
+    Reuses a cached policy when available; otherwise reads just the coverage
+    fields via ``get_policy_coverage_fields``.
+    """
+    policy = _cache_get(policy_number)
+    if policy is not None:
+        return {
+            "has_coverage": policy.has_coverage(coverage_type),
+            "coverage_limit": policy.get_limit(coverage_type),
+            "deductible": policy.deductible,
+        }
+
+    fields = await get_policy_coverage_fields(policy_number, coverage_type)
+    if fields is None:
         return {
             "has_coverage": False,
             "coverage_limit": None,
@@ -219,8 +452,9 @@ async def check_coverage(policy_number: str, coverage_type: str) -> dict:
             "error": "Policy not found",
         }
 
+    has_coverage, coverage_limit, deductible = fields
     return {
-        "has_coverage": policy.has_coverage(coverage_type),
-        "coverage_limit": policy.get_limit(coverage_type),
-        "deductible": policy.deductible,
+        "has_coverage": has_coverage,
+        "coverage_limit": coverage_limit,
+        "deductible": deductible,
     }
@@ -2,22 +2,23 @@
 
 from __future__ import annotations
 
-import json
+import functools
 import logging
+from contextlib import asynccontextmanager
 from datetime import datetime, timedelta, timezone
-from typing import List, Optional, Tuple
+from typing import AsyncIterator, List, Optional, Sequence, Tuple
 
+import orjson
+from pydantic import TypeAdapter
 from sqlalchemy import text
 from sqlalchemy.ext.asyncio import AsyncConnection
 
 from app.db.database import fetch_all, fetch_one
 from app.models.workbench import (
     AIAssessment,
-    AssessmentStatus,
     AuditLogCreate,
     Claim,
     ClaimDecision,
-    ClaimPriority,
     ClaimStatus,
     ClaimUpdate,
     Handler,
@@ -25,25 +26,228 @@ from app.models.workbench import (
 
 logger = logging.getLogger(__name__)
 
+_CLAIMS_ADAPTER = TypeAdapter(List[Claim])
+
+# Top-1-per-claim as a LATERAL probe: each claim reads the first entry of
+# idx_assessments_claim_created instead of deduplicating all assessments,
+# so a LIMITed page only touches the assessments of the claims it returns.
 LATEST_ASSESSMENT_JOIN = """
-LEFT JOIN (
-    SELECT DISTINCT ON (claim_id)
-        claim_id,
+LEFT JOIN LATERAL (
+    SELECT
         status,
         agent_outputs,
         final_recommendation
     FROM ai_assessments
-    ORDER BY claim_id, created_at DESC
-) la ON la.claim_id = c.id
+    WHERE claim_id = c.id
+    ORDER BY created_at DESC
+    LIMIT 1
+) la ON true
 """
 
+# Columns Claim is built from; priority_rank and any future wide columns
+# stay in the table.
+CLAIM_COLUMNS = (
+    "id",
+    "claimant_name",
+    "claimant_id",
+    "policy_number",
+    "claim_type",
+    "description",
+    "incident_date",
+    "estimated_damage",
+    "location",
+    "status",
+    "priority",
+    "assigned_handler_id",
+    "version",
+    "created_at",
+    "updated_at",
+)
+
+_CLAIM_COLUMN_LIST = ", ".join(CLAIM_COLUMNS)
+
+HANDLER_COLUMNS = "id, name, email, is_active, created_at"
+
+# Select list shared by every query that produces a Claim from "claims c"
+# (or a CTE aliased as c) joined to LATEST_ASSESSMENT_JOIN.
+CLAIM_SELECT = ",\n    ".join(
+    [f"c.{column}" for column in CLAIM_COLUMNS]
+    + [
+        "la.status AS latest_assessment_status",
+        "la.agent_outputs AS agent_outputs",
+        "la.final_recommendation AS final_recommendation",
+    ]
+)
+
+# Wraps an "UPDATE claims ... RETURNING" so the updated row comes back
+# together with its latest assessment in the same statement.
+_RETURN_UPDATED_CLAIM = f"""
+SELECT
+    {CLAIM_SELECT}
+FROM updated c
+{LATEST_ASSESSMENT_JOIN}
+"""
+
+_UPDATABLE_CLAIM_FIELDS = (
+    "status",
+    "priority",
+    "assigned_handler_id",
+    "description",
+    "estimated_damage",
+)
+
+
+@functools.lru_cache(maxsize=2 ** (len(_UPDATABLE_CLAIM_FIELDS) + 1))
+def _update_claim_sql(fields: Tuple[str, ...], check_version: bool = False) -> str:
+    """Build (once per field combination) the UPDATE used by update_claim."""
+    set_clause = ", ".join(f"{name} = :{name}" for name in fields)
+    version_check = "AND version = :expected_version" if check_version else ""
+    return f"""
+        WITH updated AS (
+            UPDATE claims
+            SET {set_clause}, updated_at = :updated_at, version = version + 1
+            WHERE id = :claim_id {version_check}
+            RETURNING {_CLAIM_COLUMN_LIST}
+        )
+        {_RETURN_UPDATED_CLAIM}
+    """
+
+
+# Every dashboard figure as one statement. Claim and decision counts come
+# from the trigger-maintained claim_status_counts / handler_decision_counts
+# tables (migrations 0007 and 0009), so only the average processing time
+# still reads claim_decisions and the audit log.
+_METRICS_SQL = """
+WITH claim_counts AS (
+    SELECT
+        COALESCE(SUM(claim_count) FILTER (
+            WHERE handler_id = :handler_id
+              AND status NOT IN ('approved', 'denied')
+        ), 0)::bigint AS my_caseload,
+        COALESCE(SUM(claim_count) FILTER (
+            WHERE handler_id = ''
+              AND assessment_status IN ('completed', 'failed')
+        ), 0)::bigint AS queue_depth,
+        COALESCE(SUM(claim_count) FILTER (
+            WHERE assessment_status IN ('pending', 'processing')
+        ), 0)::bigint AS processing_queue_depth,
+        COALESCE(SUM(claim_count) FILTER (WHERE status = 'new'), 0)::bigint AS status_new,
+        COALESCE(SUM(claim_count) FILTER (WHERE status = 'assigned'), 0)::bigint AS status_assigned,
+        COALESCE(SUM(claim_count) FILTER (WHERE status = 'in_progress'), 0)::bigint AS status_in_progress,
+        COALESCE(SUM(claim_count) FILTER (WHERE status = 'awaiting_info'), 0)::bigint AS status_awaiting_info,
+        COALESCE(SUM(claim_count) FILTER (WHERE status = 'approved'), 0)::bigint AS status_approved,
+        COALESCE(SUM(claim_count) FILTER (WHERE status = 'denied'), 0)::bigint AS status_denied
+    FROM claim_status_counts
+),
+decision_counts AS (
+    SELECT
+        COALESCE(SUM(decision_count) FILTER (
+            WHERE handler_id = :handler_id AND day = :day
+        ), 0)::bigint AS processed_today,
+        COALESCE(SUM(decision_count) FILTER (
+            WHERE handler_id = 'system' AND day = :day
+        ), 0)::bigint AS auto_approved_today,
+        COALESCE(SUM(decision_count) FILTER (WHERE handler_id = 'system'), 0)::bigint AS auto_approved_total
+    FROM handler_decision_counts
+    WHERE handler_id IN (:handler_id, 'system')
+)
+SELECT
+    cc.*,
+    dc.*,
+    (
+        SELECT AVG(EXTRACT(EPOCH FROM (cd.created_at - al.assigned_at)) / 60.0)
+        FROM claim_decisions cd
+        JOIN (
+            SELECT claim_id, MAX(timestamp) AS assigned_at
+            FROM claim_audit_log
+            WHERE action = 'assigned'
+            GROUP BY claim_id
+        ) al ON al.claim_id = cd.claim_id
+        WHERE cd.handler_id = :handler_id
+    ) AS avg_processing_time
+FROM claim_counts cc, decision_counts dc
+"""
+
+# Keyset pagination: rows that sort after the cursor claim in
+# (priority_rank, created_at DESC, id DESC) order.
+_KEYSET_CURSOR_JOIN = """
+JOIN claims cur ON cur.id = :after_id
+    AND (
+        c.priority_rank > cur.priority_rank
+        OR (c.priority_rank = cur.priority_rank AND c.created_at < cur.created_at)
+        OR (
+            c.priority_rank = cur.priority_rank
+            AND c.created_at = cur.created_at
+            AND c.id < cur.id
+        )
+    )
+"""
+
+
+class VersionConflictError(RuntimeError):
+    """Raised when an optimistic-locked claim update finds a newer version."""
+
+    def __init__(self, claim_id: str, expected_version: int):
+        super().__init__(
+            f"Claim {claim_id} is no longer at version {expected_version}"
+        )
+        self.claim_id = claim_id
+        self.expected_version = expected_version
+
+
+class NoChangesError(ValueError):
+    """Raised when update_claim is given a ClaimUpdate with no fields set."""
+
+
+class ClaimAlreadyAssignedError(RuntimeError):
+    """Raised when assigning a claim that another handler already holds."""
+
+    def __init__(self, claim_id: str, handler_id: str):
+        super().__init__(f"Claim {claim_id} is already assigned to {handler_id}")
+        self.claim_id = claim_id
+        self.handler_id = handler_id
+
 
 def _coerce_json(value):
     if isinstance(value, str):
-        return json.loads(value)
+        return orjson.loads(value)
     return value
 
 
+def _dumps_json(value) -> Optional[str]:
+    """Encode a JSON column value; ``None`` and empty containers become NULL."""
+    if not value:
+        return None
+    # Agent outputs may carry non-string (e.g. integer) keys
+    return orjson.dumps(value, option=orjson.OPT_NON_STR_KEYS).decode()
+
+
+def _claim_data(row) -> dict:
+    """Turn a claim row into Claim input, deriving the AI summary fields.
+
+    Enum and datetime columns are left raw for Claim's validator to coerce.
+    """
+    data = dict(row)
+
+    agent_outputs_raw = data.pop("agent_outputs", None)
+    final_rec = data.pop("final_recommendation", None)
+    if agent_outputs_raw:
+        agent_outputs = _coerce_json(agent_outputs_raw) or {}
+        risk = agent_outputs.get("risk_analyst") or {}
+        synth = agent_outputs.get("synthesizer") or {}
+        data["ai_risk_level"] = risk.get("risk_level")
+        data["ai_risk_score"] = risk.get("risk_score")
+        data["ai_recommendation"] = synth.get("recommendation") or final_rec
+
+    if data.get("assigned_handler_id") == "system" and data["status"] == ClaimStatus.APPROVED.value:
+        raw_rec = data.get("ai_recommendation")
+        if raw_rec and raw_rec != "APPROVE":
+            data["ai_recommendation"] = "APPROVE"
+            data["ai_recommendation_override"] = raw_rec
+
+    return data
+
+
 def _parse_filter_datetime(value: str, *, end_of_day: bool = False) -> datetime:
     normalized = value.replace("Z", "+00:00")
     parsed = datetime.fromisoformat(normalized)
@@ -54,11 +258,92 @@ def _parse_filter_datetime(value: str, *, end_of_day: bool = False) -> datetime:
     return parsed
 
 
+def _claim_filters(
+    handler_id: Optional[str] = None,
+    status: Optional[ClaimStatus] = None,
+    claim_type: Optional[str] = None,
+    created_from: Optional[str] = None,
+    created_to: Optional[str] = None,
+    search: Optional[str] = None,
+    assessment_statuses: Optional[List[str]] = None,
+    unassigned_only: bool = False,
+) -> Tuple[str, dict[str, object]]:
+    """Build the WHERE clause and bind parameters shared by claim list queries."""
+    conditions: list[str] = []
+    params: dict[str, object] = {}
+
+    if handler_id is not None:
+        conditions.append("c.assigned_handler_id = :handler_id")
+        params["handler_id"] = handler_id
+
+    if unassigned_only:
+        conditions.append("c.assigned_handler_id IS NULL")
+
+    if status is not None:
+        conditions.append("c.status = :status")
+        params["status"] = status.value
+
+    if claim_type is not None:
+        conditions.append("c.claim_type = :claim_type")
+        params["claim_type"] = claim_type
+
+    if created_from is not None:
+        conditions.append("c.created_at >= :created_from")
+        params["created_from"] = _parse_filter_datetime(created_from)
+
+    if created_to is not None:
+        conditions.append("c.created_at <= :created_to")
+        params["created_to"] = _parse_filter_datetime(created_to, end_of_day=True)
+
+    if search is not None and search.strip():
+        conditions.append("(c.id = :search_exact OR lower(c.claimant_name) LIKE :search_like)")
+        params["search_exact"] = search.strip()
+        params["search_like"] = f"%{search.strip().lower()}%"
+
+    if assessment_statuses:
+        placeholders = []
+        for index, assessment_status in enumerate(assessment_statuses):
+            param_name = f"assessment_status_{index}"
+            placeholders.append(f":{param_name}")
+            params[param_name] = assessment_status
+        conditions.append(f"la.status IN ({', '.join(placeholders)})")
+
+    where_clause = f"WHERE {' AND '.join(conditions)}" if conditions else ""
+    return where_clause, params
+
+
 class ClaimRepository:
     """Repository for claim workflow operations."""
 
     def __init__(self, db: AsyncConnection):
         self.db = db
+        self._in_transaction = False
+
+    @asynccontextmanager
+    async def transaction(self) -> AsyncIterator["ClaimRepository"]:
+        """Group several writes into one commit.
+
+        Writes made inside the block skip their own commit; the block commits
+        once on exit or rolls back on error. Nested blocks join the outer one.
+        """
+        if self._in_transaction:
+            yield self
+            return
+
+        self._in_transaction = True
+        try:
+            yield self
+        except BaseException:
+            await self.db.rollback()
+            raise
+        else:
+            await self.db.commit()
+        finally:
+            self._in_transaction = False
+
+    async def _commit(self) -> None:
+        if not self._in_transaction:
+            await self.db.commit()
 
     async def create_claim(self, claim: Claim) -> Claim:
         """Create a new claim."""
@@ -99,116 +384,33 @@ class ClaimRepository:
                 "created_at": claim.created_at,
             },
         )
-        await self.db.commit()
-        logger.info("Claim %s created and committed successfully", claim.id)
+        await self._commit()
+        logger.info("Claim %s created successfully", claim.id)
         return claim
 
     async def get_metrics(self, handler_id: str) -> dict:
-        """Get dashboard metrics for a handler."""
-        assigned_row = await fetch_one(
-            self.db,
-            """
-            SELECT COUNT(*) AS count
-            FROM claims
-            WHERE assigned_handler_id = :handler_id
-              AND status NOT IN ('approved', 'denied')
-            """,
-            {"handler_id": handler_id},
-        )
-
-        queue_row = await fetch_one(
-            self.db,
-            f"""
-            SELECT COUNT(*) AS count
-            FROM claims c
-            {LATEST_ASSESSMENT_JOIN}
-            WHERE c.assigned_handler_id IS NULL
-              AND la.status IN ('completed', 'failed')
-            """,
-        )
-
-        processing_row = await fetch_one(
-            self.db,
-            f"""
-            SELECT COUNT(*) AS count
-            FROM claims c
-            {LATEST_ASSESSMENT_JOIN}
-            WHERE la.status IN ('pending', 'processing')
-            """,
-        )
-
-        processed_row = await fetch_one(
-            self.db,
-            """
-            SELECT COUNT(*) AS count
-            FROM claim_decisions
-            WHERE handler_id = :handler_id
-              AND created_at::date = CURRENT_DATE
-            """,
-            {"handler_id": handler_id},
-        )
-
-        avg_row = await fetch_one(
-            self.db,
-            """
-            SELECT AVG(EXTRACT(EPOCH FROM (cd.created_at - al.assigned_at)) / 60.0)
-                AS avg_processing_time
-            FROM claim_decisions cd
-            JOIN (
-                SELECT claim_id, MAX(timestamp) AS assigned_at
-                FROM claim_audit_log
-                WHERE action = 'assigned'
-                GROUP BY claim_id
-            ) al ON al.claim_id = cd.claim_id
-            WHERE cd.handler_id = :handler_id
-            """,
-            {"handler_id": handler_id},
-        )
-
-        auto_today_row = await fetch_one(
-            self.db,
-            """
-            SELECT COUNT(*) AS count
-            FROM claim_decisions
-            WHERE handler_id = 'system'
-              AND created_at::date = CURRENT_DATE
-            """,
-        )
-
-        auto_total_row = await fetch_one(
-            self.db,
-            """
-            SELECT COUNT(*) AS count
-            FROM claim_decisions
-            WHERE handler_id = 'system'
-            """,
-        )
-
-        status_rows = await fetch_all(
+        """Get dashboard metrics for a handler in a single round-trip."""
+        row = await fetch_one(
             self.db,
-            """
-            SELECT status, COUNT(*) AS count
-            FROM claims
-            GROUP BY status
-            """,
+            _METRICS_SQL,
+            {"handler_id": handler_id, "day": datetime.now(timezone.utc).date()},
         )
-        status_counts = {row["status"]: row["count"] for row in status_rows}
 
-        avg_processing_time = avg_row["avg_processing_time"] if avg_row else 0
+        avg_processing_time = row["avg_processing_time"]
         return {
-            "my_caseload": assigned_row["count"] if assigned_row else 0,
-            "queue_depth": queue_row["count"] if queue_row else 0,
-            "processing_queue_depth": processing_row["count"] if processing_row else 0,
-            "processed_today": processed_row["count"] if processed_row else 0,
+            "my_caseload": row["my_caseload"],
+            "queue_depth": row["queue_depth"],
+            "processing_queue_depth": row["processing_queue_depth"],
+            "processed_today": row["processed_today"],
             "avg_processing_time_minutes": round(float(avg_processing_time), 2) if avg_processing_time else 0,
-            "auto_approved_today": auto_today_row["count"] if auto_today_row else 0,
-            "auto_approved_total": auto_total_row["count"] if auto_total_row else 0,
-            "status_new": status_counts.get("new", 0),
-            "status_assigned": status_counts.get("assigned", 0),
-            "status_in_progress": status_counts.get("in_progress", 0),
-            "status_awaiting_info": status_counts.get("awaiting_info", 0),
-            "status_approved": status_counts.get("approved", 0),
-            "status_denied": status_counts.get("denied", 0),
+            "auto_approved_today": row["auto_approved_today"],
+            "auto_approved_total": row["auto_approved_total"],
+            "status_new": row["status_new"],
+            "status_assigned": row["status_assigned"],
+            "status_in_progress": row["status_in_progress"],
+            "status_awaiting_info": row["status_awaiting_info"],
+            "status_approved": row["status_approved"],
+            "status_denied": row["status_denied"],
         }
 
     async def get_claim(self, claim_id: str) -> Optional[Claim]:
@@ -217,10 +419,7 @@ class ClaimRepository:
             self.db,
             f"""
             SELECT
-                c.*,
-                la.status AS latest_assessment_status,
-                la.agent_outputs AS agent_outputs,
-                la.final_recommendation AS final_recommendation
+                {CLAIM_SELECT}
             FROM claims c
             {LATEST_ASSESSMENT_JOIN}
             WHERE c.id = :claim_id
@@ -241,10 +440,16 @@ class ClaimRepository:
         unassigned_only: bool = False,
         limit: int = 50,
         offset: int = 0,
+        after: Optional[str] = None,
     ) -> Tuple[List[Claim], int]:
-        """Get claims with optional filters."""
+        """Get claims with optional filters.
+
+        Pass the ID of the last claim of the previous page as ``after`` for
+        keyset pagination; ``offset`` is then ignored. ``total`` always counts
+        every matching claim.
+        """
         logger.info(
-            "get_claims called: handler_id=%s, status=%s, claim_type=%s, created_from=%s, created_to=%s, search=%s, assessment_statuses=%s, limit=%s, offset=%s",
+            "get_claims called: handler_id=%s, status=%s, claim_type=%s, created_from=%s, created_to=%s, search=%s, assessment_statuses=%s, limit=%s, offset=%s, after=%s",
             handler_id,
             status,
             claim_type,
@@ -254,90 +459,110 @@ class ClaimRepository:
             assessment_statuses,
             limit,
             offset,
+            after,
         )
 
-        conditions: list[str] = []
-        params: dict[str, object] = {"limit": limit, "offset": offset}
-
-        if handler_id is not None:
-            conditions.append("c.assigned_handler_id = :handler_id")
-            params["handler_id"] = handler_id
-
-        if unassigned_only:
-            conditions.append("c.assigned_handler_id IS NULL")
-
-        if status is not None:
-            conditions.append("c.status = :status")
-            params["status"] = status.value
-
-        if claim_type is not None:
-            conditions.append("c.claim_type = :claim_type")
-            params["claim_type"] = claim_type
-
-        if created_from is not None:
-            conditions.append("c.created_at >= :created_from")
-            params["created_from"] = _parse_filter_datetime(created_from)
-
-        if created_to is not None:
-            conditions.append("c.created_at <= :created_to")
-            params["created_to"] = _parse_filter_datetime(created_to, end_of_day=True)
-
-        if search is not None and search.strip():
-            conditions.append("(c.id = :search_exact OR lower(c.claimant_name) LIKE :search_like)")
-            params["search_exact"] = search.strip()
-            params["search_like"] = f"%{search.strip().lower()}%"
-
-        if assessment_statuses:
-            placeholders = []
-            for index, assessment_status in enumerate(assessment_statuses):
-                param_name = f"assessment_status_{index}"
-                placeholders.append(f":{param_name}")
-                params[param_name] = assessment_status
-            conditions.append(f"la.status IN ({', '.join(placeholders)})")
-
-        where_clause = f"WHERE {' AND '.join(conditions)}" if conditions else ""
-
-        count_row = await fetch_one(
-            self.db,
-            f"""
-            SELECT COUNT(*) AS total
-            FROM claims c
-            {LATEST_ASSESSMENT_JOIN}
-            {where_clause}
-            """,
-            params,
+        where_clause, params = _claim_filters(
+            handler_id=handler_id,
+            status=status,
+            claim_type=claim_type,
+            created_from=created_from,
+            created_to=created_to,
+            search=search,
+            assessment_statuses=assessment_statuses,
+            unassigned_only=unassigned_only,
         )
-        total = count_row["total"] if count_row else 0
+        params.update(limit=limit, offset=0 if after else offset)
+
+        # Offset pages read the total off the page itself; a keyset cursor
+        # hides earlier rows from the window, so those count separately.
+        cursor_join = ""
+        total_column = ",\n                COUNT(*) OVER () AS total_count"
+        if after is not None:
+            cursor_join = _KEYSET_CURSOR_JOIN
+            total_column = ""
+            params["after_id"] = after
 
         rows = await fetch_all(
             self.db,
             f"""
             SELECT
-                c.*,
-                la.status AS latest_assessment_status,
-                la.agent_outputs AS agent_outputs,
-                la.final_recommendation AS final_recommendation
+                {CLAIM_SELECT}{total_column}
             FROM claims c
+            {cursor_join}
             {LATEST_ASSESSMENT_JOIN}
             {where_clause}
-            ORDER BY
-                CASE c.priority
-                    WHEN 'urgent' THEN 1
-                    WHEN 'high' THEN 2
-                    WHEN 'medium' THEN 3
-                    WHEN 'low' THEN 4
-                    ELSE 5
-                END,
-                c.created_at DESC
+            ORDER BY c.priority_rank, c.created_at DESC, c.id DESC
             LIMIT :limit OFFSET :offset
             """,
             params,
         )
 
-        claims = [self._row_to_claim(row) for row in rows]
+        if after is None and rows:
+            total = rows[0]["total_count"]
+        elif after is None and offset == 0:
+            total = 0
+        else:
+            # Past the last page, or paging by cursor
+            count_row = await fetch_one(
+                self.db,
+                f"""
+                SELECT COUNT(*) AS total
+                FROM claims c
+                {LATEST_ASSESSMENT_JOIN}
+                {where_clause}
+                """,
+                params,
+            )
+            total = count_row["total"] if count_row else 0
+
+        # Validate the whole page in one call instead of one model per row
+        claims = _CLAIMS_ADAPTER.validate_python([_claim_data(row) for row in rows])
         logger.info("get_claims: returning %s claims", len(claims))
         return claims, total
 
+    async def iter_claims(
+        self,
+        handler_id: Optional[str] = None,
+        status: Optional[ClaimStatus] = None,
+        claim_type: Optional[str] = None,
+        created_from: Optional[str] = None,
+        created_to: Optional[str] = None,
+        search: Optional[str] = None,
+        assessment_statuses: Optional[List[str]] = None,
+        unassigned_only: bool = False,
+    ) -> AsyncIterator[Claim]:
+        """Yield every matching claim, in list order, through a server-side cursor.
+
+        Unlike ``get_claims`` this is unpaginated and never buffers the full
+        result, so it suits exports of arbitrary size.
+        """
+        where_clause, params = _claim_filters(
+            handler_id=handler_id,
+            status=status,
+            claim_type=claim_type,
+            created_from=created_from,
+            created_to=created_to,
+            search=search,
+            assessment_statuses=assessment_statuses,
+            unassigned_only=unassigned_only,
+        )
+        result = await self.db.stream(
+            text(
+                f"""
+                SELECT
+                    {CLAIM_SELECT}
+                FROM claims c
+                {LATEST_ASSESSMENT_JOIN}
+                {where_clause}
+                ORDER BY c.priority_rank, c.created_at DESC, c.id DESC
+                """
+            ),
+            params,
+        )
+        async for row in result.mappings():
+            yield self._row_to_claim(row)
+
     async def get_review_queue(
         self,
         status: Optional[ClaimStatus] = None,
@@ -347,6 +572,7 @@ class ClaimRepository:
         search: Optional[str] = None,
         limit: int = 50,
         offset: int = 0,
+        after: Optional[str] = None,
     ) -> Tuple[List[Claim], int]:
         """Get AI-processed, unassigned claims ready for review."""
         if status is None:
@@ -361,6 +587,7 @@ class ClaimRepository:
             unassigned_only=True,
             limit=limit,
             offset=offset,
+            after=after,
         )
 
     async def get_processing_queue(
@@ -371,6 +598,7 @@ class ClaimRepository:
         search: Optional[str] = None,
         limit: int = 50,
         offset: int = 0,
+        after: Optional[str] = None,
     ) -> Tuple[List[Claim], int]:
         """Get claims currently pending or processing AI."""
         return await self.get_claims(
@@ -381,81 +609,61 @@ class ClaimRepository:
             assessment_statuses=["pending", "processing"],
             limit=limit,
             offset=offset,
+            after=after,
         )
 
     async def update_claim(self, claim_id: str, update: ClaimUpdate) -> Optional[Claim]:
-        """Update claim fields and return the refreshed claim."""
-        set_parts: list[str] = []
+        """Update claim fields and return the refreshed claim.
+
+        When ``update.expected_version`` is set the write only applies if the
+        claim is still at that version; otherwise ``VersionConflictError`` is
+        raised. Returns ``None`` if the claim does not exist and raises
+        ``NoChangesError`` if ``update`` sets no fields.
+        """
         params: dict[str, object] = {"claim_id": claim_id}
 
         if update.status is not None:
-            set_parts.append("status = :status")
             params["status"] = update.status.value
 
         if update.priority is not None:
-            set_parts.append("priority = :priority")
             params["priority"] = update.priority.value
 
         if update.assigned_handler_id is not None:
-            set_parts.append("assigned_handler_id = :assigned_handler_id")
             params["assigned_handler_id"] = update.assigned_handler_id
 
         if update.description is not None:
-            set_parts.append("description = :description")
             params["description"] = update.description
 
         if update.estimated_damage is not None:
-            set_parts.append("estimated_damage = :estimated_damage")
             params["estimated_damage"] = update.estimated_damage
 
-        if not set_parts:
-            return await self.get_claim(claim_id)
+        if len(params) == 1:
+            # Nothing to write; callers that want the current row use get_claim
+            raise NoChangesError(f"No claim fields to update for {claim_id}")
 
-        set_parts.append("updated_at = :updated_at")
+        fields = tuple(name for name in _UPDATABLE_CLAIM_FIELDS if name in params)
+        check_version = update.expected_version is not None
+        if check_version:
+            params["expected_version"] = update.expected_version
         params["updated_at"] = datetime.now(timezone.utc)
-        set_parts.append("version = version + 1")
+        row = await fetch_one(self.db, _update_claim_sql(fields, check_version), params)
 
-        row = await fetch_one(
-            self.db,
-            f"""
-            UPDATE claims
-            SET {', '.join(set_parts)}
-            WHERE id = :claim_id
-            RETURNING id
-            """,
-            params,
-        )
-        await self.db.commit()
+        if row is None and check_version:
+            # Only pay for the extra lookup on the failure path
+            exists = await fetch_one(
+                self.db,
+                "SELECT 1 FROM claims WHERE id = :claim_id",
+                {"claim_id": claim_id},
+            )
+            if exists is not None:
+                raise VersionConflictError(claim_id, update.expected_version)
 
-        if row is None:
-            return None
-        return await self.get_claim(claim_id)
+        await self._commit()
+
+        return self._row_to_claim(row) if row else None
 
     def _row_to_claim(self, row) -> Claim:
-        data = dict(row)
-        data["status"] = ClaimStatus(data["status"])
-        data["priority"] = ClaimPriority(data["priority"])
-
-        if data.get("latest_assessment_status"):
-            data["latest_assessment_status"] = AssessmentStatus(data["latest_assessment_status"])
-
-        agent_outputs_raw = data.pop("agent_outputs", None)
-        final_rec = data.pop("final_recommendation", None)
-        if agent_outputs_raw:
-            agent_outputs = _coerce_json(agent_outputs_raw) or {}
-            risk = agent_outputs.get("risk_analyst") or {}
-            synth = agent_outputs.get("synthesizer") or {}
-            data["ai_risk_level"] = risk.get("risk_level")
-            data["ai_risk_score"] = risk.get("risk_score")
-            data["ai_recommendation"] = synth.get("recommendation") or final_rec
-
-        if data.get("assigned_handler_id") == "system" and data["status"] == ClaimStatus.APPROVED:
-            raw_rec = data.get("ai_recommendation")
-            if raw_rec and raw_rec != "APPROVE":
-                data["ai_recommendation"] = "APPROVE"
-                data["ai_recommendation_override"] = raw_rec
-
-        return Claim(**data)
+        return Claim.model_validate(_claim_data(row))
 
     async def get_latest_assessment(self, claim_id: str) -> Optional[AIAssessment]:
         """Get the latest AI assessment for a claim."""
@@ -488,22 +696,32 @@ class ClaimRepository:
         return row["status"] if row else None
 
     async def assign_claim(self, claim_id: str, handler_id: str) -> Optional[Claim]:
-        """Assign a claim to a handler if it is currently unassigned."""
-        latest_status = await self.get_latest_assessment_status(claim_id)
-        if latest_status not in ("completed", "failed"):
-            return None
+        """Assign a claim to a handler if it is currently unassigned.
 
+        Returns ``None`` if the claim does not exist or its AI assessment has
+        not finished; raises ``ClaimAlreadyAssignedError`` if someone holds it.
+        """
         row = await fetch_one(
             self.db,
-            """
-            UPDATE claims
-            SET assigned_handler_id = :handler_id,
-                status = 'assigned',
-                updated_at = :updated_at,
-                version = version + 1
-            WHERE id = :claim_id
-              AND assigned_handler_id IS NULL
-            RETURNING id
+            f"""
+            WITH updated AS (
+                UPDATE claims
+                SET assigned_handler_id = :handler_id,
+                    status = 'assigned',
+                    updated_at = :updated_at,
+                    version = version + 1
+                WHERE id = :claim_id
+                  AND assigned_handler_id IS NULL
+                  AND (
+                      SELECT status
+                      FROM ai_assessments
+                      WHERE claim_id = :claim_id
+                      ORDER BY created_at DESC
+                      LIMIT 1
+                  ) IN ('completed', 'failed')
+                RETURNING {_CLAIM_COLUMN_LIST}
+            )
+            {_RETURN_UPDATED_CLAIM}
             """,
             {
                 "handler_id": handler_id,
@@ -511,25 +729,37 @@ class ClaimRepository:
                 "claim_id": claim_id,
             },
         )
-        await self.db.commit()
 
         if row is None:
-            return None
-        return await self.get_claim(claim_id)
+            # The guarded UPDATE matched nothing; find out why
+            current = await fetch_one(
+                self.db,
+                "SELECT assigned_handler_id FROM claims WHERE id = :claim_id",
+                {"claim_id": claim_id},
+            )
+            if current is not None and current["assigned_handler_id"] is not None:
+                raise ClaimAlreadyAssignedError(claim_id, current["assigned_handler_id"])
+
+        await self._commit()
+
+        return self._row_to_claim(row) if row else None
 
     async def unassign_claim(self, claim_id: str, handler_id: str) -> Optional[Claim]:
         """Unassign a claim and return it to the review queue."""
         row = await fetch_one(
             self.db,
-            """
-            UPDATE claims
-            SET assigned_handler_id = NULL,
-                status = 'new',
-                updated_at = :updated_at,
-                version = version + 1
-            WHERE id = :claim_id
-              AND assigned_handler_id = :handler_id
-            RETURNING id
+            f"""
+            WITH updated AS (
+                UPDATE claims
+                SET assigned_handler_id = NULL,
+                    status = 'new',
+                    updated_at = :updated_at,
+                    version = version + 1
+                WHERE id = :claim_id
+                  AND assigned_handler_id = :handler_id
+                RETURNING {_CLAIM_COLUMN_LIST}
+            )
+            {_RETURN_UPDATED_CLAIM}
             """,
             {
                 "updated_at": datetime.now(timezone.utc),
@@ -537,28 +767,24 @@ class ClaimRepository:
                 "handler_id": handler_id,
             },
         )
-        await self.db.commit()
+        await self._commit()
 
-        if row is None:
-            return None
-        return await self.get_claim(claim_id)
+        return self._row_to_claim(row) if row else None
 
     def _row_to_assessment(self, row) -> AIAssessment:
         data = dict(row)
-        if data.get("status"):
-            data["status"] = AssessmentStatus(data["status"])
         if data.get("agent_outputs") is not None:
             data["agent_outputs"] = _coerce_json(data["agent_outputs"])
         if data.get("confidence_scores") is not None:
             data["confidence_scores"] = _coerce_json(data["confidence_scores"])
-        return AIAssessment(**data)
+        return AIAssessment.model_validate(data)
 
     async def get_handlers(self) -> List[Handler]:
         """Get all active handlers."""
         rows = await fetch_all(
             self.db,
-            """
-            SELECT *
+            f"""
+            SELECT {HANDLER_COLUMNS}
             FROM handlers
             WHERE is_active = true
             ORDER BY name
@@ -570,7 +796,7 @@ class ClaimRepository:
         """Get handler by ID."""
         row = await fetch_one(
             self.db,
-            "SELECT * FROM handlers WHERE id = :handler_id",
+            f"SELECT {HANDLER_COLUMNS} FROM handlers WHERE id = :handler_id",
             {"handler_id": handler_id},
         )
         return Handler(**dict(row)) if row else None
@@ -599,7 +825,7 @@ class ClaimRepository:
                 "created_at": decision.created_at,
             },
         )
-        await self.db.commit()
+        await self._commit()
         return decision
 
     async def create_assessment(self, assessment: AIAssessment) -> AIAssessment:
@@ -622,16 +848,16 @@ class ClaimRepository:
                 "id": assessment.id,
                 "claim_id": assessment.claim_id,
                 "status": assessment.status.value,
-                "agent_outputs": json.dumps(assessment.agent_outputs) if assessment.agent_outputs else None,
+                "agent_outputs": _dumps_json(assessment.agent_outputs),
                 "final_recommendation": assessment.final_recommendation,
-                "confidence_scores": json.dumps(assessment.confidence_scores) if assessment.confidence_scores else None,
+                "confidence_scores": _dumps_json(assessment.confidence_scores),
                 "processing_started_at": assessment.processing_started_at,
                 "processing_completed_at": assessment.processing_completed_at,
                 "error_message": assessment.error_message,
                 "created_at": assessment.created_at,
             },
         )
-        await self.db.commit()
+        await self._commit()
         return assessment
 
     async def update_assessment(self, assessment: AIAssessment) -> AIAssessment:
@@ -652,42 +878,48 @@ class ClaimRepository:
             ),
             {
                 "status": assessment.status.value,
-                "agent_outputs": json.dumps(assessment.agent_outputs) if assessment.agent_outputs else None,
+                "agent_outputs": _dumps_json(assessment.agent_outputs),
                 "final_recommendation": assessment.final_recommendation,
-                "confidence_scores": json.dumps(assessment.confidence_scores) if assessment.confidence_scores else None,
+                "confidence_scores": _dumps_json(assessment.confidence_scores),
                 "processing_started_at": assessment.processing_started_at,
                 "processing_completed_at": assessment.processing_completed_at,
                 "error_message": assessment.error_message,
                 "id": assessment.id,
             },
         )
-        await self.db.commit()
+        await self._commit()
         return assessment
 
     async def create_audit_entry(self, entry: AuditLogCreate) -> None:
         """Create an audit log entry."""
-        import uuid
+        await self.create_audit_entries([entry])
+
+    async def create_audit_entries(self, entries: Sequence[AuditLogCreate]) -> None:
+        """Create several audit log entries with one executemany."""
+        if not entries:
+            return
 
-        now = datetime.now(timezone.utc)
+        # id and timestamp come from column defaults (gen_random_uuid(), now())
         await self.db.execute(
             text(
                 """
                 INSERT INTO claim_audit_log (
-                    id, claim_id, handler_id, action, old_value, new_value, timestamp
+                    claim_id, handler_id, action, old_value, new_value
                 ) VALUES (
-                    :id, :claim_id, :handler_id, :action,
-                    CAST(:old_value AS jsonb), CAST(:new_value AS jsonb), :timestamp
+                    :claim_id, :handler_id, :action,
+                    CAST(:old_value AS jsonb), CAST(:new_value AS jsonb)
                 )
                 """
             ),
-            {
-                "id": str(uuid.uuid4()),
-                "claim_id": entry.claim_id,
-                "handler_id": entry.handler_id,
-                "action": entry.action.value,
-                "old_value": json.dumps(entry.old_value) if entry.old_value else None,
-                "new_value": json.dumps(entry.new_value) if entry.new_value else None,
-                "timestamp": now,
-            },
+            [
+                {
+                    "claim_id": entry.claim_id,
+                    "handler_id": entry.handler_id,
+                    "action": entry.action.value,
+                    "old_value": _dumps_json(entry.old_value),
+                    "new_value": _dumps_json(entry.new_value),
+                }
+                for entry in entries
+            ],
         )
-        await self.db.commit()
+        await self._commit()
@@ -11,8 +11,10 @@ from sqlalchemy import text
 from sqlalchemy.ext.asyncio import AsyncConnection
 
 from app.db.database import fetch_all, fetch_one
+from app.db.policy_repo import invalidate_policy_cache
 from app.models.scenario import (
     ClaimType,
+    Complexity,
     GeneratedScenario,
     Locale,
     SavedScenario,
@@ -29,6 +31,42 @@ def _coerce_json(value):
     return value
 
 
+_INSERT_SCENARIO_SQL = """
+    INSERT INTO saved_scenarios (
+        id, name, locale, claim_type, complexity, scenario_data, created_at
+    )
+    VALUES (
+        :id, :name, :locale, :claim_type, :complexity, CAST(:scenario_data AS jsonb), :created_at
+    )
+"""
+
+
+def _scenario_params(scenario: GeneratedScenario, name: str, now: datetime) -> dict:
+    scenario_dict = scenario.model_dump(mode="json")
+    scenario_dict["name"] = name
+    return {
+        "id": scenario.id,
+        "name": name,
+        "locale": scenario.locale.value,
+        "claim_type": scenario.claim_type.value,
+        "complexity": scenario.complexity.value,
+        "scenario_data": json.dumps(scenario_dict),
+        "created_at": now,
+    }
+
+
+def _to_summary(scenario: GeneratedScenario, name: str, now: datetime) -> SavedScenarioSummary:
+    return SavedScenarioSummary(
+        id=scenario.id,
+        name=name,
+        locale=scenario.locale,
+        claim_type=scenario.claim_type,
+        complexity=scenario.complexity,
+        estimated_damage=scenario.claim.estimated_damage,
+        created_at=now,
+    )
+
+
 class ScenarioRepository:
     """Repository for saved scenario CRUD operations."""
 
@@ -38,59 +76,82 @@ class ScenarioRepository:
     async def create(self, scenario: GeneratedScenario, name: str) -> SavedScenarioSummary:
         """Save a generated scenario to the database."""
         now = datetime.now(timezone.utc)
-        scenario_dict = scenario.model_dump(mode="json")
-        scenario_dict["name"] = name
-
         await self.db.execute(
-            text(
-                """
-                INSERT INTO saved_scenarios (
-                    id, name, locale, claim_type, complexity, scenario_data, created_at
-                )
-                VALUES (
-                    :id, :name, :locale, :claim_type, :complexity, CAST(:scenario_data AS jsonb), :created_at
-                )
-                """
-            ),
-            {
-                "id": scenario.id,
-                "name": name,
-                "locale": scenario.locale.value,
-                "claim_type": scenario.claim_type.value,
-                "complexity": scenario.complexity.value,
-                "scenario_data": json.dumps(scenario_dict),
-                "created_at": now,
-            },
+            text(_INSERT_SCENARIO_SQL),
+            _scenario_params(scenario, name, now),
         )
         await self.db.commit()
 
         logger.info("Saved scenario '%s' with ID %s", name, scenario.id)
 
-        return SavedScenarioSummary(
-            id=scenario.id,
-            name=name,
-            locale=scenario.locale,
-            claim_type=scenario.claim_type,
-            complexity=scenario.complexity,
-            estimated_damage=scenario.claim.estimated_damage,
-            created_at=now,
+        return _to_summary(scenario, name, now)
+
+    async def create_if_not_exists(
+        self, scenario: GeneratedScenario, name: str
+    ) -> Optional[SavedScenarioSummary]:
+        """Save a generated scenario unless one with the same ID already exists.
+
+        Returns ``None`` when the ID is taken. The existence check and insert
+        happen in a single statement, so concurrent saves cannot race.
+        """
+        now = datetime.now(timezone.utc)
+        row = await fetch_one(
+            self.db,
+            _INSERT_SCENARIO_SQL + " ON CONFLICT (id) DO NOTHING RETURNING id",
+            _scenario_params(scenario, name, now),
         )
+        await self.db.commit()
+        if row is None:
+            return None
+
+        logger.info("Saved scenario '%s' with ID %s", name, scenario.id)
+
+        return _to_summary(scenario, name, now)
 
     async def get_by_id(self, scenario_id: str) -> Optional[SavedScenario]:
         """Retrieve a saved scenario by ID."""
+        found = await self.get_by_id_with_version(scenario_id)
+        return found[0] if found else None
+
+    async def get_by_id_with_version(
+        self, scenario_id: str
+    ) -> Optional[tuple[SavedScenario, datetime]]:
+        """Retrieve a saved scenario by ID together with its row version.
+
+        The version is ``updated_at`` falling back to ``created_at`` and changes
+        whenever the stored row does, so callers can use it for ETags.
+        """
         row = await fetch_one(
             self.db,
-            "SELECT * FROM saved_scenarios WHERE id = :scenario_id",
+            """
+            SELECT scenario_data, updated_at, COALESCE(updated_at, created_at) AS version
+            FROM saved_scenarios
+            WHERE id = :scenario_id
+            """,
             {"scenario_id": scenario_id},
         )
         if not row:
             return None
 
         scenario_data = _coerce_json(row["scenario_data"])
-        return SavedScenario(
+        scenario = SavedScenario(
             **scenario_data,
             updated_at=row["updated_at"],
         )
+        return scenario, row["version"]
+
+    async def get_version(self, scenario_id: str) -> Optional[datetime]:
+        """Return a scenario's row version without loading its document."""
+        row = await fetch_one(
+            self.db,
+            """
+            SELECT COALESCE(updated_at, created_at) AS version
+            FROM saved_scenarios
+            WHERE id = :scenario_id
+            """,
+            {"scenario_id": scenario_id},
+        )
+        return row["version"] if row else None
 
     async def list(
         self,
@@ -123,7 +184,10 @@ class ScenarioRepository:
         rows = await fetch_all(
             self.db,
             f"""
-            SELECT id, name, locale, claim_type, complexity, scenario_data, created_at
+            SELECT
+                id, name, locale, claim_type, complexity, created_at,
+                COALESCE((scenario_data -> 'claim' ->> 'estimated_damage')::float8, 0)
+                    AS estimated_damage
             FROM saved_scenarios
             WHERE {where_clause}
             ORDER BY created_at DESC
@@ -132,20 +196,21 @@ class ScenarioRepository:
             params,
         )
 
-        scenarios = []
-        for row in rows:
-            scenario_data = _coerce_json(row["scenario_data"])
-            scenarios.append(
-                SavedScenarioSummary(
-                    id=row["id"],
-                    name=row["name"],
-                    locale=Locale(row["locale"]),
-                    claim_type=ClaimType(row["claim_type"]),
-                    complexity=scenario_data.get("complexity", "moderate"),
-                    estimated_damage=scenario_data.get("claim", {}).get("estimated_damage", 0),
-                    created_at=row["created_at"],
-                )
+        # Summaries only need two scalar fields from scenario_data, so extract
+        # them in SQL rather than shipping the full document (policy markdown
+        # included) for every row.
+        scenarios = [
+            SavedScenarioSummary(
+                id=row["id"],
+                name=row["name"],
+                locale=Locale(row["locale"]),
+                claim_type=ClaimType(row["claim_type"]),
+                complexity=Complexity(row["complexity"]),
+                estimated_damage=row["estimated_damage"],
+                created_at=row["created_at"],
             )
+            for row in rows
+        ]
 
         return ScenarioListResponse(
             scenarios=scenarios,
@@ -164,6 +229,8 @@ class ScenarioRepository:
 
         deleted = result.rowcount > 0
         if deleted:
+            # Policies cascade with the scenario; drop any cached copies too
+            invalidate_policy_cache(scenario_id=scenario_id)
             logger.info("Deleted scenario with ID %s", scenario_id)
 
         return deleted
@@ -3,11 +3,11 @@
 from __future__ import annotations
 
 import logging
-from datetime import datetime, timezone
 from typing import Optional
 
 from pydantic import BaseModel
 from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncConnection
 
 from app.db.database import fetch_one, get_db_connection
 
@@ -58,35 +58,41 @@ def _row_to_vehicle_record(row) -> VehicleRecord:
     )
 
 
-async def create_vehicle(vehicle: VehicleCreate) -> VehicleRecord:
-    """Create a new vehicle record in the database."""
-    created_at = datetime.now(timezone.utc)
+def _vehicle_params(vehicle: VehicleCreate) -> dict:
+    return {
+        "vin": vehicle.vin,
+        "scenario_id": vehicle.scenario_id,
+        "policy_number": vehicle.policy_number,
+        "make": vehicle.make,
+        "model": vehicle.model,
+        "year": vehicle.year,
+        "license_plate": vehicle.license_plate,
+        "color": vehicle.color,
+        "vehicle_type": vehicle.vehicle_type,
+    }
+
+
+_INSERT_VEHICLE_SQL = """
+    INSERT INTO vehicles (
+        vin, scenario_id, policy_number, make, model,
+        year, license_plate, color, vehicle_type
+    ) VALUES (
+        :vin, :scenario_id, :policy_number, :make, :model,
+        :year, :license_plate, :color, :vehicle_type
+    )
+"""
 
-    async with get_db_connection() as db:
-        await db.execute(
-            text(
-                """
-                INSERT INTO vehicles (
-                    vin, scenario_id, policy_number, make, model,
-                    year, license_plate, color, vehicle_type, created_at
-                ) VALUES (
-                    :vin, :scenario_id, :policy_number, :make, :model,
-                    :year, :license_plate, :color, :vehicle_type, :created_at
-                )
-                """
-            ),
-            {
-                "vin": vehicle.vin,
-                "scenario_id": vehicle.scenario_id,
-                "policy_number": vehicle.policy_number,
-                "make": vehicle.make,
-                "model": vehicle.model,
-                "year": vehicle.year,
-                "license_plate": vehicle.license_plate,
-                "color": vehicle.color,
-                "vehicle_type": vehicle.vehicle_type,
-                "created_at": created_at,
-            },
+
+async def create_vehicle(
+    vehicle: VehicleCreate,
+    conn: Optional[AsyncConnection] = None,
+) -> VehicleRecord:
+    """Create a new vehicle record in the database."""
+    async with get_db_connection(conn) as db:
+        row = await fetch_one(
+            db,
+            _INSERT_VEHICLE_SQL + " RETURNING created_at",
+            _vehicle_params(vehicle),
         )
         await db.commit()
 
@@ -106,8 +112,37 @@ async def create_vehicle(vehicle: VehicleCreate) -> VehicleRecord:
         license_plate=vehicle.license_plate,
         color=vehicle.color,
         vehicle_type=vehicle.vehicle_type,
-        created_at=created_at.isoformat(),
+        created_at=row["created_at"].isoformat(),
+    )
+
+
+async def upsert_vehicle(
+    vehicle: VehicleCreate,
+    conn: Optional[AsyncConnection] = None,
+) -> Optional[VehicleRecord]:
+    """Insert a vehicle unless one with the same VIN already exists.
+
+    Uses a single ``INSERT ... ON CONFLICT DO NOTHING RETURNING`` round-trip
+    instead of a lookup followed by an insert. Returns the created record, or
+    ``None`` when the VIN was already present.
+    """
+    async with get_db_connection(conn) as db:
+        row = await fetch_one(
+            db,
+            _INSERT_VEHICLE_SQL + " ON CONFLICT (vin) DO NOTHING RETURNING *",
+            _vehicle_params(vehicle),
+        )
+        await db.commit()
+
+    if row is None:
+        return None
+
+    logger.info(
+        "Created vehicle record: VIN=%s, policy=%s",
+        vehicle.vin,
+        vehicle.policy_number,
     )
+    return _row_to_vehicle_record(row)
 
 
 async def get_vehicle_by_vin(vin: str) -> Optional[VehicleRecord]:
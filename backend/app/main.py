@@ -1,20 +1,65 @@
+from contextlib import asynccontextmanager
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import ORJSONResponse
+import asyncio
 import logging
 import os
+import time
 
 from app.api.v1.endpoints import workflow as workflow_endpoints
 from app.api.v1.endpoints import files as files_endpoints
 from app.api.v1.endpoints import agent as agent_endpoints
 from app.api.v1.endpoints import claims as claims_endpoints
 from app.api.v1.endpoints import metrics as metrics_endpoints
+from app.services.scenario_generator import get_scenario_generator
 from app.workflow.policy_search import get_policy_search
 
 # Configure logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
-app = FastAPI()
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Warm up the policy search index and re-index saved policies before serving."""
+    started = time.perf_counter()
+    logger.info("🚀 Initializing policy search index...")
+    try:
+        # Loading the embedding model and FAISS index is blocking work; keep it
+        # off the event loop and out of the first request's latency.
+        await asyncio.to_thread(get_policy_search)
+        logger.info("✅ Policy search index initialized successfully")
+    except Exception as e:
+        logger.error("❌ Failed to initialize policy search index: %s", e)
+        # Don't raise - let the app start but log the error
+
+    try:
+        await asyncio.to_thread(get_scenario_generator)
+    except Exception as e:
+        logger.error("❌ Failed to initialize scenario generator: %s", e)
+
+    # Re-index policies from saved scenarios (Feature 005)
+    logger.info("🔄 Re-indexing policies from saved scenarios...")
+    try:
+        from app.db.database import init_db
+        from app.services.scenario_generator import reindex_saved_policies
+
+        # Ensure database tables exist (including new vehicles/policies tables)
+        await init_db()
+
+        # Re-index all saved policies into FAISS
+        indexed_count = await reindex_saved_policies()
+        logger.info("✅ Re-indexed %s policies from saved scenarios", indexed_count)
+    except Exception as e:
+        logger.error("❌ Failed to re-index saved policies: %s", e)
+        # Don't raise - let the app start but log the error
+
+    logger.info("Startup warm-up finished in %.2fs", time.perf_counter() - started)
+    yield
+
+
+app = FastAPI(lifespan=lifespan, default_response_class=ORJSONResponse)
 
 # Add CORS middleware
 frontend_origin = os.getenv("FRONTEND_ORIGIN")
@@ -61,33 +106,6 @@ app.add_middleware(
 )
 
 
-@app.on_event("startup")
-async def startup_event():
-    """Initialize policy search index and re-index saved policies on startup."""
-    logger.info("🚀 Initializing policy search index...")
-    try:
-        policy_search = get_policy_search()
-        logger.info("✅ Policy search index initialized successfully")
-    except Exception as e:
-        logger.error("❌ Failed to initialize policy search index: %s", e)
-        # Don't raise - let the app start but log the error
-    
-    # Re-index policies from saved scenarios (Feature 005)
-    logger.info("🔄 Re-indexing policies from saved scenarios...")
-    try:
-        from app.db.database import init_db
-        from app.services.scenario_generator import reindex_saved_policies
-        
-        # Ensure database tables exist (including new vehicles/policies tables)
-        await init_db()
-        
-        # Re-index all saved policies into FAISS
-        indexed_count = await reindex_saved_policies()
-        logger.info(f"✅ Re-indexed {indexed_count} policies from saved scenarios")
-    except Exception as e:
-        logger.error("❌ Failed to re-index saved policies: %s", e)
-        # Don't raise - let the app start but log the error
-
 # Root
 
 
@@ -5,21 +5,20 @@ import json
 
 
 def _json_safe(obj: Any) -> Any:
-    """Convert numpy types to Python native for JSON serialization."""
-    try:
-        import numpy as np
-        if isinstance(obj, np.floating):
-            return float(obj)
-        if isinstance(obj, np.integer):
-            return int(obj)
-        if isinstance(obj, np.ndarray):
-            return obj.tolist()
-    except ImportError:
-        pass
+    """Convert numpy types to Python native for JSON serialization.
+
+    numpy values are recognised by their type's module, so numpy is never
+    imported here.
+    """
     if isinstance(obj, dict):
         return {k: _json_safe(v) for k, v in obj.items()}
     if isinstance(obj, list):
         return [_json_safe(v) for v in obj]
+    if type(obj).__module__ == "numpy":
+        # Scalars (np.float64, np.int32, ...) and arrays both expose tolist()
+        tolist = getattr(obj, "tolist", None)
+        if tolist is not None:
+            return tolist()
     return obj
 
 
@@ -96,8 +95,12 @@ class ClaimIn(BaseModel):
         return {k: v for k, v in self.model_dump().items() if v is not None}
 
     def is_sample_claim_request(self) -> bool:
-        """Check if this is a request for sample data (only claim_id provided)."""
-        data = self.to_dict()
+        """Check if this is a request for sample data (only claim_id provided).
+
+        Decides on the fields the client actually sent, so defaults such as
+        ``summary_language`` don't turn ``{"claim_id": ...}`` into an override.
+        """
+        data = self.model_dump(exclude_unset=True, exclude_none=True)
         return len(data) == 1 and "claim_id" in data
 
 
@@ -241,6 +241,8 @@ class VehicleInfo(BaseModel):
     model: str = Field(..., description="Vehicle model")
     year: int = Field(..., ge=1900, le=2100, description="Manufacturing year")
     license_plate: str = Field(..., description="License plate (locale format)")
+    color: Optional[str] = Field(default=None, description="Vehicle color")
+    vehicle_type: Optional[str] = Field(default=None, description="Vehicle type (e.g., sedan, SUV)")
 
 
 class CustomerInfo(BaseModel):
@@ -259,6 +261,11 @@ class CoverageLimits(BaseModel):
     property_damage: float = Field(default=100000, description="Property damage limit")
     medical_payments: float = Field(default=10000, description="Medical payments limit")
 
+    @property
+    def limits_dict(self) -> dict[str, float]:
+        """Limits keyed by coverage type."""
+        return self.model_dump()
+
 
 class Deductibles(BaseModel):
     """Deductible amounts."""
@@ -89,6 +89,8 @@ class ClaimUpdate(BaseModel):
     assigned_handler_id: Optional[str] = None
     description: Optional[str] = None
     estimated_damage: Optional[float] = None
+    # Optimistic lock: only apply the update if the claim is still at this version
+    expected_version: Optional[int] = None
 
 class Claim(ClaimBase):
     id: str
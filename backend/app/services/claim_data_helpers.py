@@ -5,6 +5,7 @@ These functions create temporary records from claim data so agent tools
 can find them during processing (Feature 005).
 """
 
+import asyncio
 import logging
 from typing import Optional
 
@@ -40,6 +41,11 @@ async def ensure_vehicle_exists(claim_data: dict) -> Optional[str]:
         logger.debug(f"Vehicle {vin} already exists")
         return vin
     
+    return await _create_vehicle_record(claim_data, vin)
+
+
+async def _create_vehicle_record(claim_data: dict, vin: str) -> Optional[str]:
+    vehicle_info = claim_data["vehicle_info"]
     try:
         vehicle_create = VehicleCreate(
             vin=vin,
@@ -82,6 +88,10 @@ async def ensure_policy_exists(claim_data: dict) -> Optional[str]:
         logger.debug(f"Policy {policy_number} already exists")
         return policy_number
     
+    return await _create_policy_record(claim_data, policy_number)
+
+
+async def _create_policy_record(claim_data: dict, policy_number: str) -> Optional[str]:
     try:
         customer_info = claim_data.get("customer_info", {})
         vehicle_info = claim_data.get("vehicle_info", {})
@@ -111,3 +121,31 @@ async def ensure_policy_exists(claim_data: dict) -> Optional[str]:
     except Exception as e:
         logger.warning(f"Could not create policy record: {e}")
         return None
+
+
+async def _none() -> None:
+    return None
+
+
+async def ensure_claim_records(claim_data: dict) -> None:
+    """Ensure both the vehicle and the policy referenced by a claim exist.
+
+    The two existence lookups run concurrently. Creation stays ordered,
+    vehicle first, because ``policies.vin`` references ``vehicles.vin``.
+
+    Args:
+        claim_data: Claim dictionary containing vehicle_info and policy_number
+    """
+    vehicle_info = claim_data.get("vehicle_info")
+    vin = vehicle_info.get("vin") if vehicle_info else None
+    policy_number = claim_data.get("policy_number")
+
+    existing_vehicle, existing_policy = await asyncio.gather(
+        get_vehicle_by_vin(vin) if vin else _none(),
+        get_policy_by_policy_number(policy_number) if policy_number else _none(),
+    )
+
+    if vin and not existing_vehicle:
+        await _create_vehicle_record(claim_data, vin)
+    if policy_number and not existing_policy:
+        await _create_policy_record(claim_data, policy_number)
@@ -64,16 +64,17 @@ class ClaimService:
             created_at=now
         )
         
-        created = await self.repo.create_claim(claim)
-        
-        # Audit log
-        await self.repo.create_audit_entry(AuditLogCreate(
-            claim_id=created.id,
-            action=AuditAction.CREATED,
-            new_value=created.model_dump(mode="json")
-        ))
-
-        # Auto-start AI processing in background
+        async with self.repo.transaction():
+            created = await self.repo.create_claim(claim)
+
+            # Audit log
+            await self.repo.create_audit_entry(AuditLogCreate(
+                claim_id=created.id,
+                action=AuditAction.CREATED,
+                new_value=created.model_dump(mode="json")
+            ))
+
+        # Auto-start AI processing in background (after commit, it reads the claim)
         asyncio.create_task(self._run_ai_processing(created.id))
 
         return created
@@ -97,7 +98,8 @@ class ClaimService:
         created_to: Optional[str] = None,
         search: Optional[str] = None,
         limit: int = 50,
-        offset: int = 0
+        offset: int = 0,
+        after: Optional[str] = None
     ) -> Tuple[List[Claim], int]:
         """Get claims assigned to a specific handler."""
         return await self.repo.get_claims(
@@ -108,7 +110,8 @@ class ClaimService:
             created_to=created_to,
             search=search,
             limit=limit,
-            offset=offset
+            offset=offset,
+            after=after
         )
 
     async def get_review_queue(
@@ -119,7 +122,8 @@ class ClaimService:
         created_to: Optional[str] = None,
         search: Optional[str] = None,
         limit: int = 50,
-        offset: int = 0
+        offset: int = 0,
+        after: Optional[str] = None
     ) -> Tuple[List[Claim], int]:
         """Get AI-processed, unassigned claims ready for review."""
         return await self.repo.get_review_queue(
@@ -129,7 +133,8 @@ class ClaimService:
             created_to=created_to,
             search=search,
             limit=limit,
-            offset=offset
+            offset=offset,
+            after=after
         )
 
     async def get_processing_queue(
@@ -139,7 +144,8 @@ class ClaimService:
         created_to: Optional[str] = None,
         search: Optional[str] = None,
         limit: int = 50,
-        offset: int = 0
+        offset: int = 0,
+        after: Optional[str] = None
     ) -> Tuple[List[Claim], int]:
         """Get claims currently pending or processing AI."""
         return await self.repo.get_processing_queue(
@@ -148,7 +154,8 @@ class ClaimService:
             created_to=created_to,
             search=search,
             limit=limit,
-            offset=offset
+            offset=offset,
+            after=after
         )
     
     async def get_claim(self, claim_id: str) -> Optional[Claim]:
@@ -175,13 +182,13 @@ class ClaimService:
             processing_started_at=now,
             created_at=now
         )
-        await self.repo.create_assessment(assessment)
-
-        await self.repo.create_audit_entry(AuditLogCreate(
-            claim_id=claim_id,
-            action=AuditAction.AI_PROCESSING_STARTED,
-            new_value={"assessment_id": assessment_id}
-        ))
+        async with self.repo.transaction():
+            await self.repo.create_assessment(assessment)
+            await self.repo.create_audit_entry(AuditLogCreate(
+                claim_id=claim_id,
+                action=AuditAction.AI_PROCESSING_STARTED,
+                new_value={"assessment_id": assessment_id}
+            ))
 
         try:
             # Prepare claim data for workflow
@@ -222,13 +229,13 @@ class ClaimService:
             assessment.confidence_scores = confidence_scores
             assessment.processing_completed_at = datetime.now(timezone.utc)
             
-            await self.repo.update_assessment(assessment)
-            
-            await self.repo.create_audit_entry(AuditLogCreate(
-                claim_id=claim_id,
-                action=AuditAction.AI_PROCESSING_COMPLETED,
-                new_value={"assessment_id": assessment_id, "status": "completed"}
-            ))
+            async with self.repo.transaction():
+                await self.repo.update_assessment(assessment)
+                await self.repo.create_audit_entry(AuditLogCreate(
+                    claim_id=claim_id,
+                    action=AuditAction.AI_PROCESSING_COMPLETED,
+                    new_value={"assessment_id": assessment_id, "status": "completed"}
+                ))
 
             # Auto-approve low-risk, low-value claims
             await self._maybe_auto_approve(claim, assessment)
@@ -240,12 +247,13 @@ class ClaimService:
             assessment.status = AssessmentStatus.FAILED
             assessment.error_message = str(e)
             assessment.processing_completed_at = datetime.now(timezone.utc)
-            await self.repo.update_assessment(assessment)
-            await self.repo.create_audit_entry(AuditLogCreate(
-                claim_id=claim_id,
-                action=AuditAction.AI_PROCESSING_COMPLETED,
-                new_value={"assessment_id": assessment_id, "status": "failed"}
-            ))
+            async with self.repo.transaction():
+                await self.repo.update_assessment(assessment)
+                await self.repo.create_audit_entry(AuditLogCreate(
+                    claim_id=claim_id,
+                    action=AuditAction.AI_PROCESSING_COMPLETED,
+                    new_value={"assessment_id": assessment_id, "status": "failed"}
+                ))
             if raise_on_error:
                 raise e
             return assessment
@@ -302,12 +310,6 @@ class ClaimService:
             return
         # Red flags are advisory; low-risk, low-value claims may still auto-approve in demo mode.
 
-        # Mark as handled by the system for UI visibility before recording the decision.
-        await self.repo.update_claim(
-            claim.id,
-            ClaimUpdate(assigned_handler_id=AUTO_APPROVE_HANDLER_ID)
-        )
-
         # Build audit note explaining the auto-approval rationale
         if recommendation and recommendation != AUTO_APPROVE_RECOMMENDATION:
             auto_note = (
@@ -324,7 +326,14 @@ class ClaimService:
             notes=auto_note,
             ai_assessment_id=assessment.id
         )
-        await self.record_decision(claim.id, decision_in)
+
+        async with self.repo.transaction():
+            # Mark as handled by the system for UI visibility before recording the decision.
+            await self.repo.update_claim(
+                claim.id,
+                ClaimUpdate(assigned_handler_id=AUTO_APPROVE_HANDLER_ID)
+            )
+            await self.record_decision(claim.id, decision_in)
 
     async def assign_claim(self, claim_id: str, handler_id: str) -> Optional[Claim]:
         """Assign a claim to a handler."""
@@ -333,16 +342,17 @@ class ClaimService:
         if not old_claim:
             return None
             
-        updated = await self.repo.assign_claim(claim_id, handler_id)
-        
-        if updated:
-            await self.repo.create_audit_entry(AuditLogCreate(
-                claim_id=claim_id,
-                handler_id=handler_id,
-                action=AuditAction.ASSIGNED,
-                old_value={"status": old_claim.status, "assigned_handler_id": old_claim.assigned_handler_id},
-                new_value={"status": updated.status, "assigned_handler_id": updated.assigned_handler_id}
-            ))
+        async with self.repo.transaction():
+            updated = await self.repo.assign_claim(claim_id, handler_id)
+
+            if updated:
+                await self.repo.create_audit_entry(AuditLogCreate(
+                    claim_id=claim_id,
+                    handler_id=handler_id,
+                    action=AuditAction.ASSIGNED,
+                    old_value={"status": old_claim.status, "assigned_handler_id": old_claim.assigned_handler_id},
+                    new_value={"status": updated.status, "assigned_handler_id": updated.assigned_handler_id}
+                ))
             
         return updated
 
@@ -352,15 +362,16 @@ class ClaimService:
         if not old_claim:
             return None
 
-        updated = await self.repo.unassign_claim(claim_id, handler_id)
-        if updated:
-            await self.repo.create_audit_entry(AuditLogCreate(
-                claim_id=claim_id,
-                handler_id=handler_id,
-                action=AuditAction.UNASSIGNED,
-                old_value={"status": old_claim.status, "assigned_handler_id": old_claim.assigned_handler_id},
-                new_value={"status": updated.status, "assigned_handler_id": updated.assigned_handler_id}
-            ))
+        async with self.repo.transaction():
+            updated = await self.repo.unassign_claim(claim_id, handler_id)
+            if updated:
+                await self.repo.create_audit_entry(AuditLogCreate(
+                    claim_id=claim_id,
+                    handler_id=handler_id,
+                    action=AuditAction.UNASSIGNED,
+                    old_value={"status": old_claim.status, "assigned_handler_id": old_claim.assigned_handler_id},
+                    new_value={"status": updated.status, "assigned_handler_id": updated.assigned_handler_id}
+                ))
         return updated
 
     async def get_metrics(self, handler_id: str) -> dict:
@@ -386,21 +397,23 @@ class ClaimService:
             created_at=now
         )
         
-        await self.repo.create_decision(decision)
-        
         # Update claim status based on decision
         new_status = ClaimStatus.APPROVED if decision.decision_type == DecisionType.APPROVED else \
                      ClaimStatus.DENIED if decision.decision_type == DecisionType.DENIED else \
                      ClaimStatus.AWAITING_INFO
-                     
-        await self.repo.update_claim(claim_id, ClaimUpdate(status=new_status))
-        
-        await self.repo.create_audit_entry(AuditLogCreate(
-            claim_id=claim_id,
-            handler_id=decision.handler_id,
-            action=AuditAction.DECISION_RECORDED,
-            old_value={"status": claim.status},
-            new_value={"status": new_status, "decision": decision.decision_type.value}
-        ))
+
+        async with self.repo.transaction():
+            await self.repo.create_decision(decision)
+            await self.repo.update_claim(
+                claim_id,
+                ClaimUpdate(status=new_status, expected_version=claim.version)
+            )
+            await self.repo.create_audit_entry(AuditLogCreate(
+                claim_id=claim_id,
+                handler_id=decision.handler_id,
+                action=AuditAction.DECISION_RECORDED,
+                old_value={"status": claim.status},
+                new_value={"status": new_status, "decision": decision.decision_type.value}
+            ))
         
         return decision
@@ -5,6 +5,7 @@ Based on research.md from specs/004-ai-demo-examples/ and 005-complete-demo-pipe
 """
 
 import asyncio
+import functools
 import json
 import logging
 import random
@@ -549,6 +550,7 @@ class ScenarioGenerator:
                 model=vi.model or "Unknown",
                 year=vi.year or year - 2,
                 license_plate=vi.license_plate or "XXX-000",
+                color=vi.color,
             )
 
         # Build customer info if present
@@ -656,6 +658,8 @@ class ScenarioGenerator:
                 model=vi.get("model", "Unknown"),
                 year=vi.get("year", year - 2),
                 license_plate=vi.get("license_plate", "XXX-000"),
+                color=vi.get("color"),
+                vehicle_type=vi.get("vehicle_type"),
             )
 
         # Build the claim
@@ -736,16 +740,10 @@ class ScenarioGenerator:
         return PRESET_TEMPLATES
 
 
-# Module-level instance for convenience
-_generator: Optional[ScenarioGenerator] = None
-
-
+@functools.lru_cache(maxsize=1)
 def get_scenario_generator() -> ScenarioGenerator:
     """Get the scenario generator singleton."""
-    global _generator
-    if _generator is None:
-        _generator = ScenarioGenerator()
-    return _generator
+    return ScenarioGenerator()
 
 
 async def reindex_saved_policies() -> int:
@@ -764,15 +762,14 @@ async def reindex_saved_policies() -> int:
     logger.info("Starting policy re-indexing from saved scenarios...")
     
     try:
-        policies = await list_all_policies()
-        
-        if not policies:
-            logger.info("No saved policies to re-index")
-            return 0
-        
         policy_search = get_policy_search()
         indexed_count = 0
-        
+
+        # Read everything up front so no connection or cursor stays open
+        # while each policy waits on a remote embedding call
+        policies = await list_all_policies()
+        total_count = len(policies)
+
         for policy in policies:
             try:
                 # Generate markdown content for the policy
@@ -818,7 +815,9 @@ async def reindex_saved_policies() -> int:
                 markdown_content = generate_policy_markdown(gen_policy, gen_claim, Locale.US)
                 
                 # Add to vector index
-                success = policy_search.add_policy_from_text(
+                # Embedding is a blocking network call; keep it off the event loop
+                success = await asyncio.to_thread(
+                    policy_search.add_policy_from_text,
                     policy_number=policy.policy_number,
                     policy_type=policy.policy_type,
                     markdown_content=markdown_content,
@@ -834,7 +833,11 @@ async def reindex_saved_policies() -> int:
                 logger.error(f"Error indexing policy {policy.policy_number}: {e}")
                 continue
         
-        logger.info(f"Policy re-indexing complete: {indexed_count}/{len(policies)} policies indexed")
+        if not total_count:
+            logger.info("No saved policies to re-index")
+            return 0
+        
+        logger.info(f"Policy re-indexing complete: {indexed_count}/{total_count} policies indexed")
         return indexed_count
         
     except Exception as e:
@@ -7,9 +7,11 @@ Uses Azure OpenAI embeddings and FAISS for efficient similarity search.
 """
 from __future__ import annotations
 
+import functools
 import logging
 import os
 import pickle
+import threading
 from pathlib import Path
 from typing import Any, Dict, List, Optional
 
@@ -47,6 +49,10 @@ class PolicyVectorSearch:  # noqa: D101
             index_path) if index_path else BASE_DIR / "policy_index"
         self.embeddings: AzureOpenAIEmbeddings | None = None
         self.vectorstore: FAISS | None = None
+        # Serialises index mutation; adds may run from worker threads
+        self._write_lock = threading.Lock()
+        # Policy numbers already added via add_policy_from_text
+        self._indexed_policy_numbers: set[str] = set()
         self._init_embeddings()
 
     # ------------------------------------------------------------------
@@ -157,9 +163,10 @@ class PolicyVectorSearch:  # noqa: D101
 
         if not force_rebuild and index_file.exists() and meta_file.exists():
             try:
-                self.vectorstore = FAISS.load_local(
+                vectorstore = FAISS.load_local(
                     str(self.index_path), self.embeddings, allow_dangerous_deserialization=True
                 )
+                self._swap_vectorstore(vectorstore)
                 logger.info("Loaded existing FAISS index")
                 return
             except Exception as e:
@@ -170,11 +177,21 @@ class PolicyVectorSearch:  # noqa: D101
         if not docs:
             raise ValueError("No documents to index")
 
-        self.vectorstore = FAISS.from_documents(docs, self.embeddings)
+        # Build the replacement aside; searches keep using the current index
+        # until the swap
+        vectorstore = FAISS.from_documents(docs, self.embeddings)
         self.index_path.mkdir(parents=True, exist_ok=True)
-        self.vectorstore.save_local(str(self.index_path))
+        vectorstore.save_local(str(self.index_path))
+        self._swap_vectorstore(vectorstore)
         logger.info("FAISS index built and saved (%s docs)", len(docs))
 
+    def _swap_vectorstore(self, vectorstore: FAISS) -> None:
+        with self._write_lock:
+            self.vectorstore = vectorstore
+            # Generated policies are never persisted, so a fresh or reloaded
+            # index contains none of them
+            self._indexed_policy_numbers.clear()
+
     # ------------------------------------------------------------------
     def search_policies(self, query: str, k: int = 5, score_threshold: float = 0.3) -> List[Dict[str, Any]]:  # noqa: D401,E501
         if FAISS is None:
@@ -204,11 +221,14 @@ class PolicyVectorSearch:  # noqa: D101
         return out
 
     # ------------------------------------------------------------------
-    def add_document_to_index(self, document_path: str | Path) -> bool:
+    def add_document_to_index(self, document_path: str | Path, persist: bool = True) -> bool:
         """Add a single document to the existing vector index.
         
         Args:
             document_path: Path to the document file (PDF or markdown)
+            persist: Write the updated index to disk. Saving rewrites the whole
+                index and docstore, so when adding several documents pass
+                ``False`` and call ``save_index()`` once at the end.
             
         Returns:
             True if document was successfully added, False otherwise
@@ -287,11 +307,11 @@ class PolicyVectorSearch:  # noqa: D101
                 
                 chunk.metadata["section"] = section or "General"
             
-            # Add chunks to existing vectorstore
-            self.vectorstore.add_documents(chunks)
-            
-            # Save updated index
-            self.vectorstore.save_local(str(self.index_path))
+            # Add chunks to existing vectorstore and save updated index
+            with self._write_lock:
+                self.vectorstore.add_documents(chunks)
+                if persist:
+                    self.vectorstore.save_local(str(self.index_path))
             
             logger.info(f"Successfully added document to index: {document_path.name} ({len(chunks)} chunks)")
             return True
@@ -300,6 +320,20 @@ class PolicyVectorSearch:  # noqa: D101
             logger.error(f"Failed to add document to index {document_path}: {e}")
             return False
 
+    # ------------------------------------------------------------------
+    def save_index(self) -> None:
+        """Persist the current vector index to disk."""
+        if not self.vectorstore:
+            raise ValueError(
+                "Vectorstore not initialised – call create_index() first")
+        with self._write_lock:
+            self.vectorstore.save_local(str(self.index_path))
+
+    # ------------------------------------------------------------------
+    def contains(self, policy_number: str) -> bool:
+        """Return True if a generated policy is already in the vector index."""
+        return policy_number in self._indexed_policy_numbers
+
     # ------------------------------------------------------------------
     def add_policy_from_text(self, policy_number: str, policy_type: str, markdown_content: str) -> bool:
         """Add a policy document from text content to the vector index.
@@ -321,6 +355,10 @@ class PolicyVectorSearch:  # noqa: D101
         if not self.vectorstore:
             logger.error("Vectorstore not initialized – call create_index() first")
             return False
+
+        if self.contains(policy_number):
+            # Already embedded; re-adding would only duplicate chunks
+            return True
             
         try:
             # Create a document from the markdown content
@@ -357,7 +395,11 @@ class PolicyVectorSearch:  # noqa: D101
                 chunk.metadata["section"] = section or "General"
             
             # Add chunks to existing vectorstore
-            self.vectorstore.add_documents(chunks)
+            with self._write_lock:
+                if policy_number in self._indexed_policy_numbers:
+                    return True
+                self.vectorstore.add_documents(chunks)
+                self._indexed_policy_numbers.add(policy_number)
             
             # Don't persist to disk for generated policies (they're session-only)
             # This keeps the index clean and avoids accumulating generated policies
@@ -380,15 +422,12 @@ class PolicyVectorSearch:  # noqa: D101
 
 
 # ---------------------------------------------------------------------------
-_policy_search_singleton: PolicyVectorSearch | None = None
-
-
+@functools.lru_cache(maxsize=1)
 def get_policy_search() -> PolicyVectorSearch:  # noqa: D401
-    global _policy_search_singleton
-    if _policy_search_singleton is None:
-        _policy_search_singleton = PolicyVectorSearch()
-        try:
-            _policy_search_singleton.create_index()
-        except Exception as e:  # pragma: no cover
-            logger.error("Could not build policy index: %s", e)
-    return _policy_search_singleton
+    """Return the shared PolicyVectorSearch instance (singleton)."""
+    policy_search = PolicyVectorSearch()
+    try:
+        policy_search.create_index()
+    except Exception as e:  # pragma: no cover
+        logger.error("Could not build policy index: %s", e)
+    return policy_search
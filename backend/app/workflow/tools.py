@@ -115,11 +115,7 @@ def get_policy_details(
         import concurrent.futures
 
         def _fetch():
-            _loop = asyncio.new_event_loop()
-            try:
-                return _loop.run_until_complete(get_policy_by_policy_number(policy_number))
-            finally:
-                _loop.close()
+            return asyncio.run(get_policy_by_policy_number(policy_number))
 
         with concurrent.futures.ThreadPoolExecutor(max_workers=1) as _pool:
             policy_record = _pool.submit(_fetch).result(timeout=5)
@@ -326,11 +322,7 @@ def get_vehicle_details(
         import concurrent.futures
 
         def _fetch_v():
-            _loop = asyncio.new_event_loop()
-            try:
-                return _loop.run_until_complete(get_vehicle_by_vin(vin))
-            finally:
-                _loop.close()
+            return asyncio.run(get_vehicle_by_vin(vin))
 
         with concurrent.futures.ThreadPoolExecutor(max_workers=1) as _pool:
             vehicle_record = _pool.submit(_fetch_v).result(timeout=5)
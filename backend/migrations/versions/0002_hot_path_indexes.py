@@ -0,0 +1,45 @@
+"""Add foreign-key and composite indexes for hot read paths."""
+
+from __future__ import annotations
+
+from alembic import op
+import sqlalchemy as sa
+
+
+revision = "0002_hot_path_indexes"
+down_revision = "0001_initial_postgres_schema"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # Foreign keys Postgres does not index on its own
+    op.create_index("idx_policies_vin", "policies", ["vin"])
+    op.create_index("idx_decisions_ai_assessment", "claim_decisions", ["ai_assessment_id"])
+    op.create_index("idx_claims_policy_number", "claims", ["policy_number"])
+
+    # "Latest row for claim X" lookups read the first index entry instead of sorting
+    op.create_index(
+        "idx_assessments_claim_created",
+        "ai_assessments",
+        ["claim_id", sa.text("created_at DESC")],
+    )
+    op.create_index(
+        "idx_audit_claim_ts",
+        "claim_audit_log",
+        ["claim_id", sa.text("timestamp DESC")],
+    )
+    # The claim_id prefix of the composites makes the single-column indexes
+    # redundant; dropping them saves a write per insert
+    op.drop_index("idx_assessments_claim", table_name="ai_assessments")
+    op.drop_index("idx_audit_claim", table_name="claim_audit_log")
+
+
+def downgrade() -> None:
+    op.create_index("idx_audit_claim", "claim_audit_log", ["claim_id"])
+    op.create_index("idx_assessments_claim", "ai_assessments", ["claim_id"])
+    op.drop_index("idx_audit_claim_ts", table_name="claim_audit_log")
+    op.drop_index("idx_assessments_claim_created", table_name="ai_assessments")
+    op.drop_index("idx_claims_policy_number", table_name="claims")
+    op.drop_index("idx_decisions_ai_assessment", table_name="claim_decisions")
+    op.drop_index("idx_policies_vin", table_name="policies")
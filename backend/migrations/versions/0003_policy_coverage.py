@@ -0,0 +1,88 @@
+"""Materialize per-policy coverage lookups into policy_coverage."""
+
+from __future__ import annotations
+
+from alembic import op
+import sqlalchemy as sa
+
+
+revision = "0003_policy_coverage"
+down_revision = "0002_hot_path_indexes"
+branch_labels = None
+depends_on = None
+
+
+# One row per lower-cased coverage name that appears in either coverage_types
+# or coverage_limits, mirroring PolicyRecord.has_coverage / get_limit.
+_COVERAGE_ROWS_SQL = """
+    SELECT
+        {policy_number} AS policy_number,
+        COALESCE(t.coverage_type, l.coverage_type) AS coverage_type,
+        t.coverage_type IS NOT NULL AS has_coverage,
+        l.limit_value
+    FROM (
+        SELECT DISTINCT lower(value) AS coverage_type
+        FROM jsonb_array_elements_text({coverage_types})
+    ) t
+    FULL OUTER JOIN (
+        SELECT DISTINCT ON (lower(key)) lower(key) AS coverage_type, value::numeric AS limit_value
+        FROM jsonb_each_text({coverage_limits})
+        ORDER BY lower(key), key
+    ) l ON l.coverage_type = t.coverage_type
+"""
+
+
+def upgrade() -> None:
+    op.create_table(
+        "policy_coverage",
+        sa.Column("policy_number", sa.Text(), nullable=False),
+        sa.Column("coverage_type", sa.Text(), nullable=False),
+        sa.Column("has_coverage", sa.Boolean(), nullable=False),
+        sa.Column("limit_value", sa.Numeric(), nullable=True),
+        sa.PrimaryKeyConstraint("policy_number", "coverage_type"),
+        sa.ForeignKeyConstraint(["policy_number"], ["policies.policy_number"], ondelete="CASCADE"),
+    )
+
+    row_sql = _COVERAGE_ROWS_SQL.format(
+        policy_number="NEW.policy_number",
+        coverage_types="NEW.coverage_types",
+        coverage_limits="NEW.coverage_limits",
+    )
+    op.execute(
+        f"""
+        CREATE FUNCTION refresh_policy_coverage() RETURNS trigger AS $$
+        BEGIN
+            DELETE FROM policy_coverage WHERE policy_number = NEW.policy_number;
+            INSERT INTO policy_coverage (policy_number, coverage_type, has_coverage, limit_value)
+            {row_sql};
+            RETURN NEW;
+        END;
+        $$ LANGUAGE plpgsql
+        """
+    )
+    op.execute(
+        """
+        CREATE TRIGGER trg_policies_refresh_coverage
+        AFTER INSERT OR UPDATE OF coverage_types, coverage_limits ON policies
+        FOR EACH ROW EXECUTE FUNCTION refresh_policy_coverage()
+        """
+    )
+
+    # Backfill policies saved before this revision
+    backfill_sql = _COVERAGE_ROWS_SQL.format(
+        policy_number="p.policy_number",
+        coverage_types="p.coverage_types",
+        coverage_limits="p.coverage_limits",
+    )
+    op.execute(
+        f"""
+        INSERT INTO policy_coverage (policy_number, coverage_type, has_coverage, limit_value)
+        SELECT c.* FROM policies p CROSS JOIN LATERAL ({backfill_sql}) c
+        """
+    )
+
+
+def downgrade() -> None:
+    op.execute("DROP TRIGGER IF EXISTS trg_policies_refresh_coverage ON policies")
+    op.execute("DROP FUNCTION IF EXISTS refresh_policy_coverage()")
+    op.drop_table("policy_coverage")
@@ -0,0 +1,34 @@
+"""Default created_at/timestamp columns to the database clock."""
+
+from __future__ import annotations
+
+from alembic import op
+import sqlalchemy as sa
+
+
+revision = "0004_created_at_defaults"
+down_revision = "0003_policy_coverage"
+branch_labels = None
+depends_on = None
+
+
+_TIMESTAMP_COLUMNS = [
+    ("saved_scenarios", "created_at"),
+    ("handlers", "created_at"),
+    ("vehicles", "created_at"),
+    ("policies", "created_at"),
+    ("claims", "created_at"),
+    ("ai_assessments", "created_at"),
+    ("claim_decisions", "created_at"),
+    ("claim_audit_log", "timestamp"),
+]
+
+
+def upgrade() -> None:
+    for table, column in _TIMESTAMP_COLUMNS:
+        op.alter_column(table, column, server_default=sa.text("now()"))
+
+
+def downgrade() -> None:
+    for table, column in _TIMESTAMP_COLUMNS:
+        op.alter_column(table, column, server_default=None)
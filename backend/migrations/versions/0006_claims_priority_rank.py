@@ -0,0 +1,48 @@
+"""Add a stored priority_rank to claims and index the work-queue orderings."""
+
+from __future__ import annotations
+
+from alembic import op
+import sqlalchemy as sa
+
+
+revision = "0006_claims_priority_rank"
+down_revision = "0005_decisions_handler_created"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.add_column(
+        "claims",
+        sa.Column(
+            "priority_rank",
+            sa.SmallInteger(),
+            sa.Computed(
+                "CASE priority"
+                " WHEN 'urgent' THEN 1"
+                " WHEN 'high' THEN 2"
+                " WHEN 'medium' THEN 3"
+                " WHEN 'low' THEN 4"
+                " ELSE 5 END",
+                persisted=True,
+            ),
+            nullable=False,
+        ),
+    )
+    op.create_index(
+        "idx_claims_handler_rank_created",
+        "claims",
+        ["assigned_handler_id", "priority_rank", sa.text("created_at DESC")],
+    )
+    op.create_index(
+        "idx_claims_status_rank_created",
+        "claims",
+        ["status", "priority_rank", sa.text("created_at DESC")],
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("idx_claims_status_rank_created", table_name="claims")
+    op.drop_index("idx_claims_handler_rank_created", table_name="claims")
+    op.drop_column("claims", "priority_rank")
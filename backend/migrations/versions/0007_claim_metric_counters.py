@@ -0,0 +1,116 @@
+"""Maintain dashboard counters for claims and decisions via triggers."""
+
+from __future__ import annotations
+
+from alembic import op
+import sqlalchemy as sa
+
+
+revision = "0007_claim_metric_counters"
+down_revision = "0006_claims_priority_rank"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # One row per (status, assignee); '' stands for "unassigned" so the
+    # pair can be a primary key.
+    op.create_table(
+        "claim_status_counts",
+        sa.Column("status", sa.Text(), nullable=False),
+        sa.Column("handler_id", sa.Text(), nullable=False, server_default=sa.text("''")),
+        sa.Column("claim_count", sa.BigInteger(), nullable=False),
+        sa.PrimaryKeyConstraint("status", "handler_id"),
+    )
+    # Decisions per handler per UTC day
+    op.create_table(
+        "handler_decision_counts",
+        sa.Column("handler_id", sa.Text(), nullable=False),
+        sa.Column("day", sa.Date(), nullable=False),
+        sa.Column("decision_count", sa.BigInteger(), nullable=False),
+        sa.PrimaryKeyConstraint("handler_id", "day"),
+    )
+
+    op.execute(
+        """
+        CREATE FUNCTION refresh_claim_status_counts() RETURNS trigger AS $$
+        BEGIN
+            IF TG_OP IN ('UPDATE', 'DELETE') THEN
+                UPDATE claim_status_counts
+                SET claim_count = claim_count - 1
+                WHERE status = OLD.status
+                  AND handler_id = COALESCE(OLD.assigned_handler_id, '');
+            END IF;
+            IF TG_OP IN ('INSERT', 'UPDATE') THEN
+                INSERT INTO claim_status_counts (status, handler_id, claim_count)
+                VALUES (NEW.status, COALESCE(NEW.assigned_handler_id, ''), 1)
+                ON CONFLICT (status, handler_id)
+                DO UPDATE SET claim_count = claim_status_counts.claim_count + 1;
+            END IF;
+            RETURN NULL;
+        END;
+        $$ LANGUAGE plpgsql
+        """
+    )
+    op.execute(
+        """
+        CREATE TRIGGER trg_claims_status_counts
+        AFTER INSERT OR DELETE OR UPDATE OF status, assigned_handler_id ON claims
+        FOR EACH ROW EXECUTE FUNCTION refresh_claim_status_counts()
+        """
+    )
+
+    op.execute(
+        """
+        CREATE FUNCTION refresh_handler_decision_counts() RETURNS trigger AS $$
+        BEGIN
+            IF TG_OP = 'DELETE' THEN
+                UPDATE handler_decision_counts
+                SET decision_count = decision_count - 1
+                WHERE handler_id = OLD.handler_id
+                  AND day = (OLD.created_at AT TIME ZONE 'UTC')::date;
+            ELSE
+                INSERT INTO handler_decision_counts (handler_id, day, decision_count)
+                VALUES (NEW.handler_id, (NEW.created_at AT TIME ZONE 'UTC')::date, 1)
+                ON CONFLICT (handler_id, day)
+                DO UPDATE SET decision_count = handler_decision_counts.decision_count + 1;
+            END IF;
+            RETURN NULL;
+        END;
+        $$ LANGUAGE plpgsql
+        """
+    )
+    op.execute(
+        """
+        CREATE TRIGGER trg_decisions_handler_counts
+        AFTER INSERT OR DELETE ON claim_decisions
+        FOR EACH ROW EXECUTE FUNCTION refresh_handler_decision_counts()
+        """
+    )
+
+    # Backfill rows written before this revision
+    op.execute(
+        """
+        INSERT INTO claim_status_counts (status, handler_id, claim_count)
+        SELECT status, COALESCE(assigned_handler_id, ''), COUNT(*)
+        FROM claims
+        GROUP BY 1, 2
+        """
+    )
+    op.execute(
+        """
+        INSERT INTO handler_decision_counts (handler_id, day, decision_count)
+        SELECT handler_id, (created_at AT TIME ZONE 'UTC')::date, COUNT(*)
+        FROM claim_decisions
+        GROUP BY 1, 2
+        """
+    )
+
+
+def downgrade() -> None:
+    op.execute("DROP TRIGGER IF EXISTS trg_decisions_handler_counts ON claim_decisions")
+    op.execute("DROP FUNCTION IF EXISTS refresh_handler_decision_counts()")
+    op.execute("DROP TRIGGER IF EXISTS trg_claims_status_counts ON claims")
+    op.execute("DROP FUNCTION IF EXISTS refresh_claim_status_counts()")
+    op.drop_table("handler_decision_counts")
+    op.drop_table("claim_status_counts")
@@ -0,0 +1,25 @@
+"""Generate claim_audit_log ids in the database."""
+
+from __future__ import annotations
+
+from alembic import op
+import sqlalchemy as sa
+
+
+revision = "0008_audit_log_id_default"
+down_revision = "0007_claim_metric_counters"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # timestamp already defaults to now() (0004_created_at_defaults)
+    op.alter_column(
+        "claim_audit_log",
+        "id",
+        server_default=sa.text("gen_random_uuid()::text"),
+    )
+
+
+def downgrade() -> None:
+    op.alter_column("claim_audit_log", "id", server_default=None)
@@ -0,0 +1,150 @@
+"""Track each claim's latest assessment status and count queue depths by it."""
+
+from __future__ import annotations
+
+from alembic import op
+import sqlalchemy as sa
+
+
+revision = "0009_queue_depth_counters"
+down_revision = "0008_audit_log_id_default"
+branch_labels = None
+depends_on = None
+
+
+_STATUS_COUNTS_FUNCTION = """
+CREATE OR REPLACE FUNCTION refresh_claim_status_counts() RETURNS trigger AS $$
+BEGIN
+    IF TG_OP IN ('UPDATE', 'DELETE') THEN
+        UPDATE claim_status_counts
+        SET claim_count = claim_count - 1
+        WHERE status = OLD.status
+          AND handler_id = COALESCE(OLD.assigned_handler_id, ''){old_match};
+    END IF;
+    IF TG_OP IN ('INSERT', 'UPDATE') THEN
+        INSERT INTO claim_status_counts (status, handler_id{columns}, claim_count)
+        VALUES (NEW.status, COALESCE(NEW.assigned_handler_id, ''){new_values}, 1)
+        ON CONFLICT (status, handler_id{columns})
+        DO UPDATE SET claim_count = claim_status_counts.claim_count + 1;
+    END IF;
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql
+"""
+
+
+def _rebuild_status_counts(group_by_assessment: bool) -> None:
+    op.execute("DELETE FROM claim_status_counts")
+    if group_by_assessment:
+        op.execute(
+            """
+            INSERT INTO claim_status_counts (status, handler_id, assessment_status, claim_count)
+            SELECT status, COALESCE(assigned_handler_id, ''), COALESCE(latest_assessment_status, ''), COUNT(*)
+            FROM claims
+            GROUP BY 1, 2, 3
+            """
+        )
+    else:
+        op.execute(
+            """
+            INSERT INTO claim_status_counts (status, handler_id, claim_count)
+            SELECT status, COALESCE(assigned_handler_id, ''), COUNT(*)
+            FROM claims
+            GROUP BY 1, 2
+            """
+        )
+
+
+def upgrade() -> None:
+    # Denormalized copy of the newest ai_assessments.status for the claim
+    op.add_column("claims", sa.Column("latest_assessment_status", sa.Text(), nullable=True))
+    op.execute(
+        """
+        UPDATE claims c
+        SET latest_assessment_status = la.status
+        FROM (
+            SELECT DISTINCT ON (claim_id) claim_id, status
+            FROM ai_assessments
+            ORDER BY claim_id, created_at DESC
+        ) la
+        WHERE la.claim_id = c.id
+        """
+    )
+    op.execute(
+        """
+        CREATE FUNCTION sync_claim_latest_assessment() RETURNS trigger AS $$
+        DECLARE
+            latest_status text;
+        BEGIN
+            SELECT status INTO latest_status
+            FROM ai_assessments
+            WHERE claim_id = NEW.claim_id
+            ORDER BY created_at DESC
+            LIMIT 1;
+
+            UPDATE claims
+            SET latest_assessment_status = latest_status
+            WHERE id = NEW.claim_id
+              AND latest_assessment_status IS DISTINCT FROM latest_status;
+            RETURN NULL;
+        END;
+        $$ LANGUAGE plpgsql
+        """
+    )
+    op.execute(
+        """
+        CREATE TRIGGER trg_assessments_sync_claim
+        AFTER INSERT OR UPDATE OF status, created_at ON ai_assessments
+        FOR EACH ROW EXECUTE FUNCTION sync_claim_latest_assessment()
+        """
+    )
+
+    # Split the claim counters by latest assessment status ('' = none yet)
+    op.add_column(
+        "claim_status_counts",
+        sa.Column("assessment_status", sa.Text(), nullable=False, server_default=sa.text("''")),
+    )
+    op.drop_constraint("claim_status_counts_pkey", "claim_status_counts", type_="primary")
+    op.create_primary_key(
+        "claim_status_counts_pkey",
+        "claim_status_counts",
+        ["status", "handler_id", "assessment_status"],
+    )
+    op.execute(
+        _STATUS_COUNTS_FUNCTION.format(
+            old_match="\n          AND assessment_status = COALESCE(OLD.latest_assessment_status, '')",
+            columns=", assessment_status",
+            new_values=", COALESCE(NEW.latest_assessment_status, '')",
+        )
+    )
+    op.execute("DROP TRIGGER trg_claims_status_counts ON claims")
+    op.execute(
+        """
+        CREATE TRIGGER trg_claims_status_counts
+        AFTER INSERT OR DELETE OR UPDATE OF status, assigned_handler_id, latest_assessment_status ON claims
+        FOR EACH ROW EXECUTE FUNCTION refresh_claim_status_counts()
+        """
+    )
+    _rebuild_status_counts(group_by_assessment=True)
+
+
+def downgrade() -> None:
+    op.execute("DROP TRIGGER trg_claims_status_counts ON claims")
+    op.execute(
+        """
+        CREATE TRIGGER trg_claims_status_counts
+        AFTER INSERT OR DELETE OR UPDATE OF status, assigned_handler_id ON claims
+        FOR EACH ROW EXECUTE FUNCTION refresh_claim_status_counts()
+        """
+    )
+    op.execute(_STATUS_COUNTS_FUNCTION.format(old_match="", columns="", new_values=""))
+    # Rows would collide on the narrower key; they are rebuilt below
+    op.execute("DELETE FROM claim_status_counts")
+    op.drop_constraint("claim_status_counts_pkey", "claim_status_counts", type_="primary")
+    op.drop_column("claim_status_counts", "assessment_status")
+    op.create_primary_key("claim_status_counts_pkey", "claim_status_counts", ["status", "handler_id"])
+    _rebuild_status_counts(group_by_assessment=False)
+
+    op.execute("DROP TRIGGER IF EXISTS trg_assessments_sync_claim ON ai_assessments")
+    op.execute("DROP FUNCTION IF EXISTS sync_claim_latest_assessment()")
+    op.drop_column("claims", "latest_assessment_status")
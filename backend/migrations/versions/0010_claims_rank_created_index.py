@@ -0,0 +1,26 @@
+"""Index the unfiltered claim list ordering."""
+
+from __future__ import annotations
+
+from alembic import op
+import sqlalchemy as sa
+
+
+revision = "0010_claims_rank_created_index"
+down_revision = "0009_queue_depth_counters"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # Matches ORDER BY priority_rank, created_at DESC, id DESC when no
+    # handler/status filter leads, so list pages and exports skip the sort
+    op.create_index(
+        "idx_claims_rank_created",
+        "claims",
+        ["priority_rank", sa.text("created_at DESC"), sa.text("id DESC")],
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("idx_claims_rank_created", table_name="claims")
@@ -0,0 +1,28 @@
+"""Trigram-index claimant names for substring search."""
+
+from __future__ import annotations
+
+from alembic import op
+
+
+revision = "0011_claimant_name_trigram"
+down_revision = "0010_claims_rank_created_index"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # pg_trgm is a trusted extension, so the database owner can enable it
+    op.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+    # Serves get_claims' lower(claimant_name) LIKE '%term%' search, which a
+    # btree cannot because of the leading wildcard
+    op.execute(
+        """
+        CREATE INDEX idx_claims_claimant_name_trgm
+        ON claims USING gin (lower(claimant_name) gin_trgm_ops)
+        """
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("idx_claims_claimant_name_trgm", table_name="claims")
@@ -0,0 +1,127 @@
+"""Shard claim_status_counts and apply each transition in one ordered upsert."""
+
+from __future__ import annotations
+
+from alembic import op
+import sqlalchemy as sa
+
+
+revision = "0012_claim_counts_sharded"
+down_revision = "0011_claimant_name_trigram"
+branch_labels = None
+depends_on = None
+
+
+# Readers already SUM(claim_count) per key, so spreading a key over shards
+# changes no query
+_SHARDS = 16
+
+_KEY_COLUMNS = "status, handler_id, assessment_status, shard"
+
+_OLD_KEY = (
+    "OLD.status, COALESCE(OLD.assigned_handler_id, ''), "
+    "COALESCE(OLD.latest_assessment_status, '')"
+)
+_NEW_KEY = (
+    "NEW.status, COALESCE(NEW.assigned_handler_id, ''), "
+    "COALESCE(NEW.latest_assessment_status, '')"
+)
+
+_UPSERT_TAIL = f"""
+        ON CONFLICT ({_KEY_COLUMNS})
+        DO UPDATE SET claim_count = t.claim_count + EXCLUDED.claim_count"""
+
+_SHARDED_FUNCTION = f"""
+CREATE OR REPLACE FUNCTION refresh_claim_status_counts() RETURNS trigger AS $$
+DECLARE
+    -- New claims pick one of several rows per key, so concurrent inserts
+    -- rarely wait on the same counter row
+    counter_shard smallint := floor(random() * {_SHARDS})::smallint;
+BEGIN
+    IF TG_OP = 'INSERT' THEN
+        INSERT INTO claim_status_counts AS t ({_KEY_COLUMNS}, claim_count)
+        VALUES ({_NEW_KEY}, counter_shard, 1){_UPSERT_TAIL};
+    ELSIF TG_OP = 'DELETE' THEN
+        INSERT INTO claim_status_counts AS t ({_KEY_COLUMNS}, claim_count)
+        VALUES ({_OLD_KEY}, counter_shard, -1){_UPSERT_TAIL};
+    ELSE
+        -- Both deltas in one statement, keys sorted: opposite transitions
+        -- (assign/unassign, A->B and B->A) lock counter rows in the same
+        -- order and cannot deadlock. Equal keys net out to no write.
+        INSERT INTO claim_status_counts AS t ({_KEY_COLUMNS}, claim_count)
+        SELECT d.status, d.handler_id, d.assessment_status, counter_shard, SUM(d.delta)
+        FROM (
+            VALUES ({_OLD_KEY}, -1), ({_NEW_KEY}, 1)
+        ) AS d (status, handler_id, assessment_status, delta)
+        GROUP BY d.status, d.handler_id, d.assessment_status
+        HAVING SUM(d.delta) <> 0
+        ORDER BY d.status, d.handler_id, d.assessment_status{_UPSERT_TAIL};
+    END IF;
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql
+"""
+
+# Definition from 0009_queue_depth_counters, restored on downgrade
+_UNSHARDED_FUNCTION = """
+CREATE OR REPLACE FUNCTION refresh_claim_status_counts() RETURNS trigger AS $$
+BEGIN
+    IF TG_OP IN ('UPDATE', 'DELETE') THEN
+        UPDATE claim_status_counts
+        SET claim_count = claim_count - 1
+        WHERE status = OLD.status
+          AND handler_id = COALESCE(OLD.assigned_handler_id, '')
+          AND assessment_status = COALESCE(OLD.latest_assessment_status, '');
+    END IF;
+    IF TG_OP IN ('INSERT', 'UPDATE') THEN
+        INSERT INTO claim_status_counts (status, handler_id, assessment_status, claim_count)
+        VALUES (NEW.status, COALESCE(NEW.assigned_handler_id, ''), COALESCE(NEW.latest_assessment_status, ''), 1)
+        ON CONFLICT (status, handler_id, assessment_status)
+        DO UPDATE SET claim_count = claim_status_counts.claim_count + 1;
+    END IF;
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql
+"""
+
+
+def upgrade() -> None:
+    op.add_column(
+        "claim_status_counts",
+        sa.Column("shard", sa.SmallInteger(), nullable=False, server_default=sa.text("0")),
+    )
+    op.drop_constraint("claim_status_counts_pkey", "claim_status_counts", type_="primary")
+    op.create_primary_key(
+        "claim_status_counts_pkey",
+        "claim_status_counts",
+        ["status", "handler_id", "assessment_status", "shard"],
+    )
+    op.execute(_SHARDED_FUNCTION)
+
+
+def downgrade() -> None:
+    op.execute(_UNSHARDED_FUNCTION)
+    # Fold the shards back into one row per key before narrowing the key
+    op.execute(
+        """
+        CREATE TEMPORARY TABLE claim_status_totals ON COMMIT DROP AS
+        SELECT status, handler_id, assessment_status, SUM(claim_count) AS claim_count
+        FROM claim_status_counts
+        GROUP BY status, handler_id, assessment_status
+        """
+    )
+    op.execute("DELETE FROM claim_status_counts")
+    op.drop_constraint("claim_status_counts_pkey", "claim_status_counts", type_="primary")
+    op.drop_column("claim_status_counts", "shard")
+    op.create_primary_key(
+        "claim_status_counts_pkey",
+        "claim_status_counts",
+        ["status", "handler_id", "assessment_status"],
+    )
+    op.execute(
+        """
+        INSERT INTO claim_status_counts (status, handler_id, assessment_status, claim_count)
+        SELECT status, handler_id, assessment_status, claim_count
+        FROM claim_status_totals
+        """
+    )
@@ -1,9 +1,12 @@
 import os
 from pathlib import Path
 
+import orjson
 import pytest
 from dotenv import load_dotenv
 
+from app.api.v1.endpoints import workflow as workflow_endpoint
+
 from tests.live_auth import skip_if_auth_error, ensure_azure_credential
 
 
@@ -53,3 +56,115 @@ async def test_workflow_run_endpoint_returns_structured_outputs(async_client):
     structured = data["agent_outputs"]["claim_assessor"]["structured_output"]
     assert structured is not None
     assert "validity_status" in structured
+
+
+def _stub_workflow_stream(monkeypatch, events, error=None):
+    """Replace the supervisor stream with canned events (and an optional failure)."""
+
+    async def _fake_stream(claim_data):
+        for event in events:
+            yield event
+        if error is not None:
+            raise error
+
+    async def _no_records(claim_data):
+        return None
+
+    monkeypatch.setattr(workflow_endpoint, "process_claim_with_supervisor_stream", _fake_stream)
+    monkeypatch.setattr(workflow_endpoint, "ensure_claim_records", _no_records)
+
+
+def _frames(response) -> list[dict]:
+    return [orjson.loads(line) for line in response.content.splitlines() if line]
+
+
+_ASSESSOR_EVENTS = [
+    {"event_type": "agent_start", "agent_name": "claim_assessor", "status": "running"},
+    {
+        "event_type": "agent_complete",
+        "agent_name": "claim_assessor",
+        "claim_assessor": {
+            "messages": [{"role": "assistant", "content": "Damage is consistent with the report."}],
+            "structured_output": {"validity_status": "VALID"},
+        },
+    },
+]
+
+
+@pytest.mark.asyncio
+async def test_workflow_stream_emits_frames_then_result(async_client, monkeypatch):
+    _stub_workflow_stream(
+        monkeypatch,
+        _ASSESSOR_EVENTS + [
+            {"event_type": "agent_start", "agent_name": "synthesizer", "status": "running"},
+            {
+                "event_type": "agent_complete",
+                "agent_name": "synthesizer",
+                "synthesizer": {
+                    "messages": [{"role": "assistant", "content": "Final decision: APPROVED"}],
+                    "structured_output": {"recommendation": "APPROVE"},
+                },
+            },
+        ],
+    )
+
+    response = await async_client.post("/api/v1/workflow/stream", json={"claim_id": "CLM-2026-001"})
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("application/x-ndjson")
+
+    assert _frames(response) == [
+        {"type": "agent_start", "agent_name": "claim_assessor", "status": "running"},
+        {
+            "type": "message",
+            "node": "claim_assessor",
+            "role": "assistant",
+            "content": "Damage is consistent with the report.",
+        },
+        {"type": "agent_start", "agent_name": "synthesizer", "status": "running"},
+        {
+            "type": "message",
+            "node": "synthesizer",
+            "role": "assistant",
+            "content": "Final decision: APPROVED",
+        },
+        {
+            "type": "result",
+            "final_decision": "APPROVED",
+            "agent_outputs": {
+                "claim_assessor": {
+                    "agent_name": "claim_assessor",
+                    "structured_output": {"validity_status": "VALID"},
+                    "tool_calls": None,
+                    "raw_text": "Damage is consistent with the report.",
+                },
+                "synthesizer": {
+                    "agent_name": "synthesizer",
+                    "structured_output": {"recommendation": "APPROVE"},
+                    "tool_calls": None,
+                    "raw_text": "Final decision: APPROVED",
+                },
+            },
+        },
+    ]
+
+
+@pytest.mark.asyncio
+async def test_workflow_stream_ends_with_error_frame_when_supervisor_fails(async_client, monkeypatch):
+    _stub_workflow_stream(monkeypatch, _ASSESSOR_EVENTS, error=RuntimeError("model unavailable"))
+
+    response = await async_client.post("/api/v1/workflow/stream", json={"claim_id": "CLM-2026-001"})
+    assert response.status_code == 200
+
+    frames = _frames(response)
+    assert [frame["type"] for frame in frames] == ["agent_start", "message", "error"]
+    assert frames[-1] == {"type": "error", "detail": "Workflow execution failed"}
+
+
+@pytest.mark.asyncio
+async def test_workflow_stream_unknown_claim_is_404(async_client, monkeypatch):
+    _stub_workflow_stream(monkeypatch, _ASSESSOR_EVENTS)
+
+    response = await async_client.post("/api/v1/workflow/stream", json={"claim_id": "CLM-DOES-NOT-EXIST"})
+    assert response.status_code == 404
+    assert response.headers["content-type"].startswith("application/json")
+    assert "CLM-DOES-NOT-EXIST" in response.json()["detail"]
@@ -3,11 +3,16 @@ from datetime import datetime, timezone
 import pytest
 from sqlalchemy import text
 
-from app.db.repositories.claim_repo import ClaimRepository
+from app.db.repositories.claim_repo import (
+    ClaimAlreadyAssignedError,
+    ClaimRepository,
+    VersionConflictError,
+)
 from app.models.workbench import (
     Claim,
     ClaimPriority,
     ClaimStatus,
+    ClaimUpdate,
     AIAssessment,
     AssessmentStatus,
 )
@@ -125,3 +130,200 @@ async def test_does_not_auto_approve_high_risk_claim(db):
     )
     decision_count = result.scalar_one()
     assert decision_count == 0
+
+
+@pytest.mark.asyncio
+async def test_repository_transaction_rolls_back_grouped_writes(db):
+    repo = ClaimRepository(db)
+
+    now = datetime.now(timezone.utc)
+    claim = Claim(
+        id="claim-rollback",
+        claimant_name="Test Customer",
+        claimant_id="CLT-1003",
+        policy_number="POL-2026-003",
+        claim_type="auto",
+        description="Rolled back before commit",
+        incident_date=now,
+        estimated_damage=500.0,
+        location="Portland, OR",
+        priority=ClaimPriority.LOW,
+        status=ClaimStatus.NEW,
+        version=1,
+        created_at=now,
+    )
+
+    with pytest.raises(RuntimeError):
+        async with repo.transaction():
+            await repo.create_claim(claim)
+            raise RuntimeError("abort")
+
+    assert await repo.get_claim(claim.id) is None
+
+
+@pytest.mark.asyncio
+async def test_update_claim_rejects_stale_version(db):
+    repo = ClaimRepository(db)
+
+    now = datetime.now(timezone.utc)
+    claim = Claim(
+        id="claim-versioned",
+        claimant_name="Test Customer",
+        claimant_id="CLT-1004",
+        policy_number="POL-2026-004",
+        claim_type="auto",
+        description="Concurrent edits",
+        incident_date=now,
+        estimated_damage=750.0,
+        location="Denver, CO",
+        priority=ClaimPriority.MEDIUM,
+        status=ClaimStatus.NEW,
+        version=1,
+        created_at=now,
+    )
+    await repo.create_claim(claim)
+
+    updated = await repo.update_claim(
+        claim.id, ClaimUpdate(priority=ClaimPriority.HIGH, expected_version=1)
+    )
+    assert updated.version == 2
+
+    with pytest.raises(VersionConflictError):
+        await repo.update_claim(
+            claim.id, ClaimUpdate(priority=ClaimPriority.LOW, expected_version=1)
+        )
+
+    assert (await repo.get_claim(claim.id)).priority == ClaimPriority.HIGH
+    assert await repo.update_claim(
+        "claim-missing", ClaimUpdate(priority=ClaimPriority.LOW, expected_version=1)
+    ) is None
+
+
+@pytest.mark.asyncio
+async def test_assign_claim_reports_current_holder(db):
+    repo = ClaimRepository(db)
+
+    now = datetime.now(timezone.utc)
+    claim = Claim(
+        id="claim-held",
+        claimant_name="Test Customer",
+        claimant_id="CLT-1005",
+        policy_number="POL-2026-005",
+        claim_type="auto",
+        description="Two handlers reach for the same claim",
+        incident_date=now,
+        estimated_damage=900.0,
+        location="Austin, TX",
+        priority=ClaimPriority.MEDIUM,
+        status=ClaimStatus.NEW,
+        version=1,
+        created_at=now,
+    )
+    await repo.create_claim(claim)
+    await repo.create_assessment(AIAssessment(
+        id="assessment-held",
+        claim_id=claim.id,
+        status=AssessmentStatus.COMPLETED,
+        created_at=now,
+    ))
+
+    assigned = await repo.assign_claim(claim.id, "handler-001")
+    assert assigned.assigned_handler_id == "handler-001"
+
+    with pytest.raises(ClaimAlreadyAssignedError) as excinfo:
+        await repo.assign_claim(claim.id, "handler-002")
+    assert excinfo.value.handler_id == "handler-001"
+
+    assert await repo.assign_claim("claim-missing", "handler-002") is None
+
+
+@pytest.mark.asyncio
+async def test_metrics_follow_trigger_maintained_counters(db):
+    repo = ClaimRepository(db)
+
+    now = datetime.now(timezone.utc)
+    claim = Claim(
+        id="claim-metrics",
+        claimant_name="Test Customer",
+        claimant_id="CLT-1006",
+        policy_number="POL-2026-006",
+        claim_type="auto",
+        description="Counted on the dashboard",
+        incident_date=now,
+        estimated_damage=300.0,
+        location="Boise, ID",
+        priority=ClaimPriority.LOW,
+        status=ClaimStatus.NEW,
+        version=1,
+        created_at=now,
+    )
+    await repo.create_claim(claim)
+    assessment = AIAssessment(
+        id="assessment-metrics",
+        claim_id=claim.id,
+        status=AssessmentStatus.PROCESSING,
+        created_at=now,
+    )
+    await repo.create_assessment(assessment)
+
+    metrics = await repo.get_metrics("handler-001")
+    assert metrics["processing_queue_depth"] == 1
+    assert metrics["queue_depth"] == 0
+    assert metrics["status_new"] == 1
+
+    assessment.status = AssessmentStatus.COMPLETED
+    await repo.update_assessment(assessment)
+    metrics = await repo.get_metrics("handler-001")
+    assert metrics["processing_queue_depth"] == 0
+    assert metrics["queue_depth"] == 1
+
+    await repo.assign_claim(claim.id, "handler-001")
+    metrics = await repo.get_metrics("handler-001")
+    assert metrics["queue_depth"] == 0
+    assert metrics["my_caseload"] == 1
+    assert metrics["status_new"] == 0
+    assert metrics["status_assigned"] == 1
+
+
+@pytest.mark.asyncio
+async def test_status_change_moves_claim_between_counter_keys(db):
+    repo = ClaimRepository(db)
+
+    now = datetime.now(timezone.utc)
+    claim = Claim(
+        id="claim-counted",
+        claimant_name="Test Customer",
+        claimant_id="CLT-1007",
+        policy_number="POL-2026-007",
+        claim_type="auto",
+        description="Moves through statuses",
+        incident_date=now,
+        estimated_damage=400.0,
+        location="Reno, NV",
+        priority=ClaimPriority.MEDIUM,
+        status=ClaimStatus.NEW,
+        version=1,
+        created_at=now,
+    )
+    await repo.create_claim(claim)
+
+    async def counts_by_status() -> dict:
+        result = await db.execute(
+            text(
+                "SELECT status, SUM(claim_count) AS total FROM claim_status_counts "
+                "GROUP BY status HAVING SUM(claim_count) <> 0"
+            )
+        )
+        return {row.status: row.total for row in result}
+
+    assert await counts_by_status() == {"new": 1}
+
+    await repo.update_claim(claim.id, ClaimUpdate(status=ClaimStatus.IN_PROGRESS))
+    assert await counts_by_status() == {"in_progress": 1}
+
+    # Changing a column the trigger watches without moving the key nets out
+    await repo.update_claim(claim.id, ClaimUpdate(status=ClaimStatus.IN_PROGRESS))
+    assert await counts_by_status() == {"in_progress": 1}
+
+    await repo.update_claim(claim.id, ClaimUpdate(status=ClaimStatus.NEW))
+    assert await counts_by_status() == {"new": 1}
@@ -48,3 +48,73 @@ async def test_claims_api_create_list_and_metrics(async_client, monkeypatch):
     metrics = metrics_response.json()
     assert metrics["my_caseload"] == 0
     assert "queue_depth" in metrics
+
+
+@pytest.mark.asyncio
+async def test_claims_api_keyset_pagination(async_client, monkeypatch):
+    async def _noop_ai_processing(self, claim_id: str) -> None:
+        return None
+
+    monkeypatch.setattr(ClaimService, "_run_ai_processing", _noop_ai_processing)
+
+    for index, priority in enumerate(["low", "urgent", "medium"]):
+        response = await async_client.post(
+            "/api/v1/claims/",
+            json={
+                "claimant_name": f"Claimant {index}",
+                "policy_number": "POL-2026-001",
+                "claim_type": "auto",
+                "description": "Paging fixture claim.",
+                "incident_date": datetime.now(timezone.utc).isoformat(),
+                "estimated_damage": 1000 + index,
+                "location": "Seattle, WA",
+                "priority": priority,
+            },
+        )
+        assert response.status_code == 201
+
+    full = (await async_client.get("/api/v1/claims/?limit=10")).json()
+    assert [claim["priority"] for claim in full] == ["urgent", "medium", "low"]
+
+    seen = []
+    after = None
+    while True:
+        url = "/api/v1/claims/?limit=1" + (f"&after={after}" if after else "")
+        page = (await async_client.get(url)).json()
+        if not page:
+            break
+        seen.extend(claim["id"] for claim in page)
+        after = page[-1]["id"]
+
+    assert seen == [claim["id"] for claim in full]
+
+
+@pytest.mark.asyncio
+async def test_claims_api_export_streams_json_array(async_client, monkeypatch):
+    async def _noop_ai_processing(self, claim_id: str) -> None:
+        return None
+
+    monkeypatch.setattr(ClaimService, "_run_ai_processing", _noop_ai_processing)
+
+    empty = await async_client.get("/api/v1/claims/export")
+    assert empty.status_code == 200
+    assert empty.json() == []
+
+    for index in range(3):
+        response = await async_client.post(
+            "/api/v1/claims/",
+            json={
+                "claimant_name": f"Exported {index}",
+                "policy_number": "POL-2026-001",
+                "claim_type": "auto",
+                "description": "Export fixture claim.",
+                "incident_date": datetime.now(timezone.utc).isoformat(),
+                "estimated_damage": 500 + index,
+                "location": "Seattle, WA",
+            },
+        )
+        assert response.status_code == 201
+
+    exported = (await async_client.get("/api/v1/claims/export")).json()
+    listed = (await async_client.get("/api/v1/claims/?limit=10")).json()
+    assert [claim["id"] for claim in exported] == [claim["id"] for claim in listed]
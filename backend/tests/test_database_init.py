@@ -22,3 +22,24 @@ async def test_init_db_is_idempotent():
 
     assert handler_count == 4
     assert policy_count == 0
+
+
+@pytest.mark.asyncio
+async def test_hot_path_indexes_exist():
+    await init_db()
+
+    async with get_engine().connect() as connection:
+        result = await connection.execute(
+            text("SELECT indexname FROM pg_indexes WHERE schemaname = current_schema()"),
+        )
+        index_names = set(result.scalars().all())
+
+    assert {
+        "idx_policies_vin",
+        "idx_decisions_ai_assessment",
+        "idx_claims_policy_number",
+        "idx_assessments_claim_created",
+        "idx_audit_claim_ts",
+    } <= index_names
+    # Superseded by the (claim_id, ...) composites above
+    assert not {"idx_assessments_claim", "idx_audit_claim"} & index_names
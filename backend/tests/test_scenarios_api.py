@@ -108,3 +108,135 @@ async def test_scenarios_api_save_lookup_and_delete(async_client):
 
     missing_response = await async_client.get(f"/api/v1/scenarios/{payload['scenario']['id']}")
     assert missing_response.status_code == 404
+
+    # Vehicle and policy records cascade with the scenario
+    vehicle_response = await async_client.get("/api/v1/scenarios/vehicles/1HGCM82633A004352")
+    assert vehicle_response.status_code == 404
+
+    policy_response = await async_client.get("/api/v1/scenarios/policies/POL-2026-001")
+    assert policy_response.status_code == 404
+
+
+@pytest.mark.asyncio
+async def test_scenarios_api_rejects_invalid_id(async_client):
+    get_response = await async_client.get("/api/v1/scenarios/not-a-uuid")
+    assert get_response.status_code == 422
+
+    delete_response = await async_client.delete("/api/v1/scenarios/not-a-uuid")
+    assert delete_response.status_code == 422
+
+
+@pytest.mark.asyncio
+async def test_scenarios_api_rejects_duplicate_save(async_client):
+    payload = _saved_scenario_payload()
+
+    create_response = await async_client.post("/api/v1/scenarios", json=payload)
+    assert create_response.status_code == 201
+
+    duplicate_response = await async_client.post("/api/v1/scenarios", json=payload)
+    assert duplicate_response.status_code == 400
+    assert duplicate_response.json()["detail"]["error"] == "already_exists"
+
+
+def test_scenarios_routes_registered_once():
+    from app.main import app
+
+    routes = [
+        (route.path, method)
+        for route in app.routes
+        if route.path.startswith("/api/v1/scenarios")
+        for method in getattr(route, "methods", ())
+    ]
+    assert routes
+    assert len(routes) == len(set(routes))
+
+
+@pytest.mark.asyncio
+async def test_scenarios_api_etag_revalidation(async_client):
+    payload = _saved_scenario_payload()
+    create_response = await async_client.post("/api/v1/scenarios", json=payload)
+    assert create_response.status_code == 201
+
+    url = f"/api/v1/scenarios/{payload['scenario']['id']}"
+    get_response = await async_client.get(url)
+    assert get_response.status_code == 200
+    etag = get_response.headers["etag"]
+
+    cached_response = await async_client.get(url, headers={"If-None-Match": etag})
+    assert cached_response.status_code == 304
+    assert cached_response.headers["etag"] == etag
+
+    templates_response = await async_client.get("/api/v1/scenarios/templates")
+    assert templates_response.status_code == 200
+    templates_etag = templates_response.headers["etag"]
+
+    cached_templates = await async_client.get(
+        "/api/v1/scenarios/templates", headers={"If-None-Match": templates_etag}
+    )
+    assert cached_templates.status_code == 304
+
+
+@pytest.mark.asyncio
+async def test_scenarios_api_coverage_reads_materialized_table(async_client):
+    from app.db.policy_repo import invalidate_policy_cache
+
+    payload = _saved_scenario_payload()
+    create_response = await async_client.post("/api/v1/scenarios", json=payload)
+    assert create_response.status_code == 201
+
+    # Bypass the in-process cache so the lookup hits policy_coverage
+    invalidate_policy_cache()
+    coverage_response = await async_client.get(
+        "/api/v1/scenarios/policies/POL-2026-001/coverage/COLLISION"
+    )
+    assert coverage_response.status_code == 200
+    coverage = coverage_response.json()
+    assert coverage["has_coverage"] is True
+    assert coverage["coverage_limit"] == 50000
+
+    invalidate_policy_cache()
+    missing_response = await async_client.get(
+        "/api/v1/scenarios/policies/POL-2026-001/coverage/flood"
+    )
+    assert missing_response.status_code == 200
+    missing = missing_response.json()
+    assert missing["has_coverage"] is False
+    assert missing["coverage_limit"] is None
+
+
+@pytest.mark.asyncio
+async def test_generated_scenario_policy_record_uses_full_coverage_and_demo_premium(monkeypatch):
+    from app.api.v1.endpoints import scenarios as scenarios_endpoint
+    from app.models.scenario import GeneratedScenario
+
+    captured = []
+
+    async def fake_upsert_policy(policy):
+        captured.append(policy)
+        return True
+
+    monkeypatch.setattr(scenarios_endpoint, "upsert_policy", fake_upsert_policy)
+    scenario = GeneratedScenario.model_validate(_saved_scenario_payload()["scenario"])
+
+    await scenarios_endpoint._maybe_create_policy(scenario)
+
+    # Same shape save_scenario writes: every CoverageLimits field and the demo premium
+    (policy,) = captured
+    assert list(policy.coverage_types) == [
+        "collision",
+        "comprehensive",
+        "liability_per_person",
+        "liability_per_accident",
+        "property_damage",
+        "medical_payments",
+    ]
+    assert policy.coverage_limits == {
+        "collision": 50000,
+        "comprehensive": 50000,
+        "liability_per_person": 100000,
+        "liability_per_accident": 300000,
+        "property_damage": 100000,
+        "medical_payments": 10000,
+    }
+    assert policy.premium == 1200.0
+    assert policy.deductible == 500